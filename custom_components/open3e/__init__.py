@@ -11,15 +11,19 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.storage import Store
 from homeassistant.util import slugify
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 from .api import Open3eMqttClient
-from .const import MQTT_CMD_KEY, MQTT_TOPIC_KEY, DOMAIN
+from .const import MQTT_CMD_KEY, MQTT_TOPIC_KEY, DOMAIN, STORAGE_VERSION, READS_PER_SECOND_KEY, READS_PER_SECOND_DEFAULT, \
+    ADAPTIVE_POLLING_KEY, ADAPTIVE_POLLING_DEFAULT
 from .ha_data import Open3eData, Open3eDataConfigEntry, Open3eDataUpdateCoordinator
+from .services import async_setup_services
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
@@ -37,6 +41,15 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the services of this integration."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(
         hass: HomeAssistant,
         entry: Open3eDataConfigEntry,
@@ -44,13 +57,15 @@ async def async_setup_entry(
     """Set up this integration using UI."""
     client = Open3eMqttClient(
         mqtt_topic=entry.data[MQTT_TOPIC_KEY],
-        mqtt_cmd=entry.data[MQTT_CMD_KEY]
+        mqtt_cmd=entry.data[MQTT_CMD_KEY],
+        reads_per_second=entry.options.get(READS_PER_SECOND_KEY, READS_PER_SECOND_DEFAULT)
     )
 
     coordinator = Open3eDataUpdateCoordinator(
         hass=hass,
         client=client,
-        entry_id=entry.entry_id
+        entry_id=entry.entry_id,
+        adaptive_polling=entry.options.get(ADAPTIVE_POLLING_KEY, ADAPTIVE_POLLING_DEFAULT)
     )
 
     entry.runtime_data = Open3eData(
@@ -71,7 +86,19 @@ async def async_unload_entry(
         entry: Open3eDataConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.coordinator.async_shutdown()
+
+    return unload_ok
+
+
+async def async_remove_entry(
+        hass: HomeAssistant,
+        entry: Open3eDataConfigEntry,
+) -> None:
+    """Remove the cached system information of a deleted entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
 
 
 async def async_reload_entry(
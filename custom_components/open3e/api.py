@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Callable, Any
+import time
+from enum import IntEnum
+from typing import Callable, Any, Awaitable
 
 import async_timeout
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import ReceiveMessage
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
@@ -21,9 +25,11 @@ from custom_components.open3e.definitions.subfeatures.program import Program
 from custom_components.open3e.definitions.subfeatures.smart_grid_temperature_offsets import SmartGridTemperatureOffsets
 from custom_components.open3e.definitions.subfeatures.temperature_cooling import TemperatureCooling
 from .capability.capability import DEVICE_CAPABILITIES, CapabilityFeature
-from .const import MQTT_SYSTEM_TOPIC, MQTT_SYSTEM_PAYLOAD
+from .const import MQTT_SYSTEM_TOPIC, MQTT_SYSTEM_PAYLOAD, OPEN3E_READ_TIMEOUT, MQTT_REQUEST_RETRY_INTERVAL, \
+    CAPABILITY_PROBE_CONCURRENCY, CAPABILITY_PROBE_TIMEOUT, READS_PER_SECOND_DEFAULT, DEVICE_MAX_READS_IN_FLIGHT
 from .definitions.devices import Open3eDevices
-from .definitions.open3e_data import Open3eDataSystemInformation, Open3eDataDeviceFeature, Open3eDataDevice
+from .definitions.open3e_data import Open3eDataSystemInformation, Open3eDataDeviceFeature, Open3eDataDevice, \
+    Open3eDataFeatureWrite, Open3eDataPayload
 from .definitions.subfeatures.buffer_mode import BufferMode
 from .definitions.subfeatures.dhw_hysteresis import DhwHysteresis
 from .definitions.subfeatures.heating_curve import HeatingCurve
@@ -35,6 +41,65 @@ from .errors import Open3eServerTimeoutError, Open3eError, Open3eServerUnavailab
 _LOGGER = logging.getLogger(__name__)
 
 
+class Open3eReadBudget:
+    """
+    Token bucket limiting the features read per second.
+    Open3e serializes all reads over one CAN interface, so reads above its capacity only queue up on the server.
+    """
+
+    __reads_per_second: float
+    __tokens: float
+    __last_refill: float
+
+    def __init__(self, reads_per_second: float):
+        self.__reads_per_second = reads_per_second
+        self.__tokens = reads_per_second
+        self.__last_refill = time.monotonic()
+
+    @property
+    def reads_per_second(self) -> float:
+        return self.__reads_per_second
+
+    def __refill(self):
+        now = time.monotonic()
+        self.__tokens = min(
+            self.__tokens + (now - self.__last_refill) * self.__reads_per_second,
+            self.__reads_per_second
+        )
+        self.__last_refill = now
+
+    def reserve(self, reads: int) -> float:
+        """
+        Reserve the given number of reads if the budget allows them.
+        Returns 0 if they were reserved, otherwise the seconds until the budget allows them.
+        More reads than fit into the budget at once are allowed once it is full and paid back afterwards.
+        """
+        self.__refill()
+        missing = min(reads, self.__reads_per_second) - self.__tokens
+        if missing > 0:
+            return missing / self.__reads_per_second
+
+        self.__tokens -= reads
+        return 0
+
+    def charge(self, reads: int):
+        """Take reads from the budget without waiting for it. Reads sent later pay back the debt."""
+        self.__refill()
+        self.__tokens -= reads
+
+
+class Open3eLane(IntEnum):
+    """Priority of a command sent to Open3e. Commands of lower lanes are only sent once higher lanes are empty."""
+    Write = 0
+    """Writes triggered by the user."""
+    Confirmation = 1
+    """Reads confirming a write or waited for by the user."""
+    FastPoll = 2
+    """Polls of features with short refresh intervals."""
+    SlowPoll = 3
+    """Polls of features with long refresh intervals."""
+
+
 class Open3eMqttClient:
     """Open3e Mqtt Client."""
 
@@ -42,13 +107,46 @@ class Open3eMqttClient:
     __mqtt_topic: str
     """Only used to return availability"""
 
+    __feature_waiters: dict[tuple[int, int], list[asyncio.Future]]
+    """Pending reads waiting for a (device_id, feature_id) to be published."""
+    __latest_payloads: dict[tuple[int, int], Open3eDataPayload]
+    """Latest payload published per (device_id, feature_id), used to skip writes that would not change anything."""
+    __feature_subscription_active: bool
+    """Whether feature messages are passed to async_on_feature_data, which then resolves the pending reads."""
+    __pending_writes: dict[tuple[int, int], int]
+    """Number of queued writes per (device_id, feature_id), whose latest payload can not be trusted meanwhile."""
+    is_payload_fresh: Callable[[int, int], bool]
+    """
+    Checks if the latest payload of a (device_id, feature_id) is recent enough to skip writes based on it.
+    Without it, no write is skipped.
+    """
+    read_budget: Open3eReadBudget
+    __device_queues: dict[int, list[tuple[Open3eLane, int, list[int] | None, str, asyncio.Future]]]
+    """Heap per device_id of (lane, sequence, feature_ids, payload, future) of commands waiting to be published."""
+    __sequence: itertools.count
+    __device_queue_changed: dict[int, asyncio.Event]
+    __device_dispatchers: dict[int, asyncio.Task]
+    __device_reads_in_flight: dict[int, int]
+
     def __init__(
             self,
             mqtt_topic: str,
-            mqtt_cmd: str
+            mqtt_cmd: str,
+            reads_per_second: int = READS_PER_SECOND_DEFAULT
     ) -> None:
         self.__mqtt_topic = mqtt_topic
         self.__mqtt_cmd = mqtt_cmd
+        self.__feature_waiters = {}
+        self.__latest_payloads = {}
+        self.__feature_subscription_active = False
+        self.__pending_writes = {}
+        self.is_payload_fresh = lambda device_id, feature_id: False
+        self.read_budget = Open3eReadBudget(reads_per_second)
+        self.__device_queues = {}
+        self.__sequence = itertools.count()
+        self.__device_queue_changed = {}
+        self.__device_dispatchers = {}
+        self.__device_reads_in_flight = {}
 
     async def async_check_availability(self, hass: HomeAssistant) -> bool:
         """
@@ -107,16 +205,37 @@ class Open3eMqttClient:
         except Exception as exception:
             raise Open3eError(exception)
 
+    async def async_subscribe_to_features(self, hass: HomeAssistant, callback: Callable[[ReceiveMessage], Any]):
+        """
+        Subscribe once to every topic below the Open3e MQTT topic.
+        Routing the messages to the matching features is up to the caller, which passes them
+        to async_on_feature_data.
+        """
+        try:
+            unsubscribe = await mqtt.async_subscribe(
+                hass=hass,
+                topic=f"{self.__mqtt_topic}/#",
+                msg_callback=callback
+            )
+            self.__feature_subscription_active = True
+            return unsubscribe
+
+        except Exception as exception:
+            raise Open3eError(exception)
+
     async def async_get_system_information(self, hass: HomeAssistant) -> Open3eDataSystemInformation:
         """
         Request system information via MQTT and return it.
         """
         event = asyncio.Event()
-        system_information: Open3eDataSystemInformation | None = None
+        payload: str | bytes | None = None
 
         def message_callback(message: ReceiveMessage):
-            nonlocal system_information
-            system_information = Open3eDataSystemInformation.from_dict(json_loads(message.payload))
+            nonlocal payload
+            if payload is not None:
+                return  # Answer to a repeated request
+
+            payload = message.payload
             hass.loop.call_soon_threadsafe(event.set)  # Signal that data has been received
 
         subscription = None
@@ -129,18 +248,20 @@ class Open3eMqttClient:
                 msg_callback=message_callback
             )
 
-            # Ensure subscription is active
-            await asyncio.sleep(1)
-
-            await mqtt.async_publish(
-                hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=MQTT_SYSTEM_PAYLOAD
+            await self.__async_request_until_answered(
+                request=lambda: mqtt.async_publish(
+                    hass=hass,
+                    topic=self.__mqtt_cmd,
+                    payload=MQTT_SYSTEM_PAYLOAD
+                ),
+                answered=event,
+                timeout=10
             )
-
-            await asyncio.wait_for(event.wait(), timeout=10)
             _LOGGER.info("System information successfully received")
 
+            # The payload lists every feature of every ECU, so decoding it must not block the event loop
+            system_information = await hass.async_add_executor_job(Open3eDataSystemInformation.from_json, payload)
+
             _LOGGER.debug("Setting device capabilities for received system information")
             await self.__set_devices_capabilities(hass=hass, system_information=system_information)
 
@@ -154,35 +275,267 @@ class Open3eMqttClient:
             if subscription:
                 subscription()
 
-    async def async_request_data(self, hass: HomeAssistant, device_features: dict[int, list[int]]):
+    async def async_request_data(
+            self,
+            hass: HomeAssistant,
+            device_features: dict[int, list[int]],
+            lane: Open3eLane = Open3eLane.SlowPoll
+    ):
+        """Request features of devices within the read budget, after all commands of higher lanes."""
+        try:
+            await asyncio.gather(*(
+                self.__async_enqueue(
+                    hass=hass,
+                    device_id=device,
+                    lane=lane,
+                    payload=self.__read_json_payload(device_id=device, feature_ids=feature_ids),
+                    feature_ids=feature_ids
+                )
+                for device, feature_ids in device_features.items()
+            ))
+
+        except Exception as exception:
+            raise Open3eError(exception)
+
+    async def __async_enqueue(
+            self,
+            hass: HomeAssistant,
+            device_id: int,
+            lane: Open3eLane,
+            payload: str,
+            feature_ids: list[int] | None = None
+    ):
+        """
+        Queue a command in the queue of its device and wait until it has been published.
+        For reads, a future resolved once Open3e published all their features is returned.
+        Feature ids are only given for reads. Polls are limited by the read budget and the reads in flight,
+        confirmations are sent right away and only charged to the budget.
+        """
+        future = hass.loop.create_future()
+        heapq.heappush(
+            self.__device_queues.setdefault(device_id, []),
+            (lane, next(self.__sequence), feature_ids, payload, future)
+        )
+        self.__device_queue_changed.setdefault(device_id, asyncio.Event()).set()
+
+        dispatcher = self.__device_dispatchers.get(device_id)
+        if dispatcher is None or dispatcher.done():
+            self.__device_dispatchers[device_id] = hass.async_create_background_task(
+                self.__async_dispatch(hass, device_id),
+                name=f"open3e dispatch commands of device {device_id}"
+            )
+
+        return await future
+
+    async def __async_dispatch(self, hass: HomeAssistant, device_id: int):
+        """
+        Publish the queued commands of a device by lane.
+        Each device has its own dispatcher, so a slow device does not hold back the others.
+        """
+        queue = self.__device_queues[device_id]
+        queue_changed = self.__device_queue_changed[device_id]
+
+        while queue:
+            lane, _, feature_ids, payload, future = queue[0]
+            if future.done():
+                heapq.heappop(queue)
+                continue
+
+            wait = None
+            if feature_ids and lane <= Open3eLane.Confirmation:
+                # Reads waited for by the user must not wait for the debt of polls that were already sent
+                self.read_budget.charge(len(feature_ids))
+            elif feature_ids:
+                if self.__device_reads_in_flight.get(device_id, 0) >= DEVICE_MAX_READS_IN_FLIGHT:
+                    wait = OPEN3E_READ_TIMEOUT
+                else:
+                    wait = self.read_budget.reserve(len(feature_ids)) or None
+
+            if wait is not None:
+                # Commands of a higher lane might be queued or reads answered while waiting
+                queue_changed.clear()
+                try:
+                    await asyncio.wait_for(queue_changed.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(queue)
+            answered = self.__track_read_in_flight(hass, device_id, feature_ids) if feature_ids else None
+
+            try:
+                await mqtt.async_publish(hass=hass, topic=self.__mqtt_cmd, payload=payload)
+            except Exception as exception:
+                if answered is not None:
+                    answered.cancel()
+                if not future.done():
+                    future.set_exception(exception)
+            else:
+                if not future.done():
+                    future.set_result(answered)
+
+    def __track_read_in_flight(self, hass: HomeAssistant, device_id: int, feature_ids: list[int]) -> asyncio.Future:
+        """
+        Count a read as in flight until Open3e published all its features or the read timed out.
+        Returns a future resolved once all features were published, which is cancelled if the read timed out.
+        """
+        self.__device_reads_in_flight[device_id] = self.__device_reads_in_flight.get(device_id, 0) + 1
+        waiters = self.__add_feature_waiters(hass, device_id, list(dict.fromkeys(feature_ids)))
+        answered = asyncio.gather(*(waiter for _, waiter in waiters))
+        timeout = hass.loop.call_later(OPEN3E_READ_TIMEOUT, answered.cancel)
+
+        def on_done(_):
+            timeout.cancel()
+            self.__remove_feature_waiters(waiters)
+            self.__device_reads_in_flight[device_id] -= 1
+            queue_changed = self.__device_queue_changed.get(device_id)
+            if queue_changed is not None:
+                queue_changed.set()
+
+        answered.add_done_callback(on_done)
+        return answered
+
+    def __add_feature_waiters(
+            self,
+            hass: HomeAssistant,
+            device_id: int,
+            feature_ids: list[int]
+    ) -> list[tuple[tuple[int, int], asyncio.Future]]:
+        """
+        Create futures resolved once the features of the device are published.
+        They are created when the read is published, as each message resolves the oldest future of its feature.
+        """
+        waiters: list[tuple[tuple[int, int], asyncio.Future]] = []
+
+        for feature_id in feature_ids:
+            key = (device_id, feature_id)
+            waiter = hass.loop.create_future()
+            self.__feature_waiters.setdefault(key, []).append(waiter)
+            waiters.append((key, waiter))
+
+        return waiters
+
+    def __remove_feature_waiters(self, waiters: list[tuple[tuple[int, int], asyncio.Future]]):
+        """Cancel and remove futures of features which have not been published."""
+        for key, waiter in waiters:
+            if waiter.done() and not waiter.cancelled():
+                continue
+
+            waiter.cancel()
+            pending = self.__feature_waiters.get(key)
+            if pending is not None and waiter in pending:
+                pending.remove(waiter)
+                if not pending:
+                    del self.__feature_waiters[key]
+
+    @callback
+    def async_shutdown(self):
+        """Cancel all queued commands."""
+        for dispatcher in self.__device_dispatchers.values():
+            dispatcher.cancel()
+        self.__device_dispatchers.clear()
+
+        for queue in self.__device_queues.values():
+            for _, _, _, _, future in queue:
+                future.cancel()
+        self.__device_queues.clear()
+
+    async def async_read(
+            self,
+            hass: HomeAssistant,
+            device_id: int,
+            feature_ids: list[int],
+            timeout: float = OPEN3E_READ_TIMEOUT,
+            lane: Open3eLane = Open3eLane.Confirmation
+    ):
+        """
+        Request features of a device and wait until Open3e has published all of them.
+        Requires the received feature messages to be passed to async_on_feature_data.
+        Answers to reads published before this one, e.g. a poll still in flight, do not complete it.
+        Raises Open3eServerTimeoutError if not all features are published within the timeout.
+        """
+        feature_ids = list(dict.fromkeys(feature_ids))
+
         try:
-            for device in device_features.keys():
-                data = ",".join(map(str, device_features[device]))
-                await mqtt.async_publish(hass=hass, topic=self.__mqtt_cmd,
-                                         payload=f'{{"mode": "read-json", "addr": "{device}", "data":[{data}]}}')
+            async with async_timeout.timeout(timeout):
+                answered = await self.__async_enqueue(
+                    hass=hass,
+                    device_id=device_id,
+                    lane=lane,
+                    payload=self.__read_json_payload(device_id=device_id, feature_ids=feature_ids),
+                    feature_ids=feature_ids
+                )
+                await asyncio.wait({answered})
 
+        except asyncio.TimeoutError:
+            raise Open3eServerTimeoutError()
         except Exception as exception:
             raise Open3eError(exception)
 
+        if answered.cancelled():
+            raise Open3eServerTimeoutError()
+
+    @callback
+    def async_on_feature_data(self, device_id: int, feature_id: int, raw: str | bytes) -> Open3eDataPayload | None:
+        """
+        Store the payload of a feature and resolve the oldest pending read waiting for it.
+        Returns the new payload or None if it is identical to the latest one.
+        """
+        key = (device_id, feature_id)
+        self.__resolve_feature_waiters(key)
+
+        latest_payload = self.__latest_payloads.get(key)
+        if latest_payload is not None and latest_payload.raw == raw:
+            return None
+
+        payload = Open3eDataPayload(raw)
+        self.__latest_payloads[key] = payload
+        return payload
+
+    def __resolve_feature_waiters(self, key: tuple[int, int]):
+        """
+        Resolve the oldest pending read waiting for a (device_id, feature_id).
+        Open3e answers reads in the order they were published, so a message answers the oldest read.
+        """
+        waiters = self.__feature_waiters.get(key)
+        if waiters is None:
+            return
+
+        while waiters:
+            waiter = waiters.pop(0)
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+        if not waiters:
+            del self.__feature_waiters[key]
+
+    def latest_payload(self, device_id: int, feature_id: int) -> Open3eDataPayload | None:
+        """Return the latest payload published for the feature of a device."""
+        return self.__latest_payloads.get((device_id, feature_id))
+
     async def async_set_program_temperature(
             self,
             hass: HomeAssistant,
             set_programs_feature_id: int,
             program: Program,
             temperature: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting programs of feature ID {set_programs_feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=set_programs_feature_id,
-                    sub_feature=program.map_to_api_heating(),
-                    data=temperature,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=set_programs_feature_id,
+                        data=temperature,
+                        sub_feature=program.map_to_api_heating()
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -193,19 +546,22 @@ class Open3eMqttClient:
             set_programs_feature_id: int,
             program: Program,
             temperature: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting programs of feature ID {set_programs_feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=set_programs_feature_id,
-                    sub_feature=program.map_to_api_cooling(),
-                    data=temperature,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=set_programs_feature_id,
+                        data=temperature,
+                        sub_feature=program.map_to_api_cooling()
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -215,18 +571,21 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             temperature: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting hot water temperature of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=temperature,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=temperature
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -236,61 +595,48 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             mode: HvacMode,
             hvac_mode_feature_id: int,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting HVAC mode {mode} of feature ID {hvac_mode_feature_id}")
-            await mqtt.async_publish(
+            data = mode.to_api()
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=hvac_mode_feature_id,
-                    data=mode.to_api(),
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=hvac_mode_feature_id,
+                        data=data,
+                        # The state is reported by the device, only the mode has to match
+                        current_if={"Mode": {"ID": data["Mode"]["ID"]}}
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
 
     async def async_set_dmw_mode(self, hass: HomeAssistant, mode: DmwMode, dmw_state_feature_id: int,
-                                 dmw_efficiency_mode_feature_id: int, device_id: int):
+                                 dmw_efficiency_mode_feature_id: int, device_id: int,
+                                 force: bool = False) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting DMW mode to {mode}")
 
-            state_payload = None
-            efficiency_payload = None
+            writes: list[Open3eDataFeatureWrite] = []
 
             match mode:
                 case DmwMode.Eco:
-                    state_payload = {"Mode": 1, "State": 1}
-                    efficiency_payload = 0
+                    writes.append(Open3eDataFeatureWrite(feature_id=dmw_state_feature_id, data={"Mode": 1, "State": 1}))
+                    writes.append(Open3eDataFeatureWrite(feature_id=dmw_efficiency_mode_feature_id, data=0))
                 case DmwMode.Comfort:
-                    state_payload = {"Mode": 1, "State": 1}
-                    efficiency_payload = 2
+                    writes.append(Open3eDataFeatureWrite(feature_id=dmw_state_feature_id, data={"Mode": 1, "State": 1}))
+                    writes.append(Open3eDataFeatureWrite(feature_id=dmw_efficiency_mode_feature_id, data=2))
                 case DmwMode.Off:
-                    state_payload = {"Mode": 0, "State": 0}
-
-            if state_payload is not None:
-                await mqtt.async_publish(
-                    hass=hass,
-                    topic=self.__mqtt_cmd,
-                    payload=self.__write_json_payload(
-                        feature_id=dmw_state_feature_id,
-                        data=state_payload,
-                        device_id=device_id
-                    )
-                )
+                    writes.append(Open3eDataFeatureWrite(feature_id=dmw_state_feature_id, data={"Mode": 0, "State": 0}))
 
-            if efficiency_payload is not None:
-                await mqtt.async_publish(
-                    hass=hass,
-                    topic=self.__mqtt_cmd,
-                    payload=self.__write_json_payload(
-                        feature_id=dmw_efficiency_mode_feature_id,
-                        data=efficiency_payload,
-                        device_id=device_id
-                    )
-                )
+            # State and efficiency mode are written with a single command
+            return await self.__async_publish_writes(hass=hass, device_id=device_id, writes=writes, force=force)
         except Exception as exception:
             raise Open3eError(exception)
 
@@ -299,18 +645,21 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             max_power: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting max power of electrical heater of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=max_power,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=max_power
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -321,19 +670,22 @@ class Open3eMqttClient:
             feature_id: int,
             offset: SmartGridTemperatureOffsets,
             value: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting {offset} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=value,
-                    sub_feature=offset,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=value,
+                        sub_feature=offset
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -343,19 +695,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             value: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting {TemperatureCooling.EffectiveSetTemperature} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=value,
-                    sub_feature=TemperatureCooling.EffectiveSetTemperature,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=value,
+                        sub_feature=TemperatureCooling.EffectiveSetTemperature
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -366,19 +721,22 @@ class Open3eMqttClient:
             feature_id: int,
             hysteresis: Hysteresis,
             value: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting {hysteresis} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=value,
-                    sub_feature=hysteresis,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=value,
+                        sub_feature=hysteresis
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -389,19 +747,22 @@ class Open3eMqttClient:
             feature_id: int,
             buffer: Buffer,
             value: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting {buffer} temperature of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=value,
-                    sub_feature=buffer,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=value,
+                        sub_feature=buffer
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -411,19 +772,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             value: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting {value} temperature of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=value,
-                    sub_feature="Temperature",
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=value,
+                        sub_feature="Temperature"
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -434,19 +798,22 @@ class Open3eMqttClient:
             feature_id: int,
             heating_curve: HeatingCurve,
             value: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting {heating_curve} temperature of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=value,
-                    sub_feature=heating_curve,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=value,
+                        sub_feature=heating_curve
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -457,19 +824,22 @@ class Open3eMqttClient:
             feature_id: int,
             hysteresis: DhwHysteresis,
             value: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting {hysteresis} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=value,
-                    sub_feature=hysteresis,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=value,
+                        sub_feature=hysteresis
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -479,18 +849,21 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             mode: BufferMode,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting buffer mode to {mode} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=mode.map_to_api(),
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=mode.map_to_api()
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -500,18 +873,21 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             is_on: bool,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting hot water quickmode to {is_on} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data={"OpMode": 2, "Required": "on" if is_on else "off", "Unknown": "0000"},
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data={"OpMode": 2, "Required": "on" if is_on else "off", "Unknown": "0000"}
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -521,18 +897,21 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             mode: VitoairQuickMode,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting quickmode to {mode} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data={"OpMode": mode.map_to_api(), "Required": "on", "Unknown": "3c00"},  # 3c00 -> 60mins
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data={"OpMode": mode.map_to_api(), "Required": "on", "Unknown": "3c00"},  # 3c00 -> 60mins
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -542,19 +921,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             is_on: bool,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting hot water pump to {is_on} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    sub_feature="State",
-                    data=1 if is_on else 0,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=1 if is_on else 0,
+                        sub_feature="State"
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -564,19 +946,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             level: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting level to {level} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=level,
-                    sub_feature="Acutual",
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=level,
+                        sub_feature="Acutual"
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -586,19 +971,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             mode: VentilationMode,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting mode to {mode} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=mode.map_to_api(),
-                    sub_feature="Mode",
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=mode.map_to_api(),
+                        sub_feature="Mode"
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -608,19 +996,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             state: BypassOperationState,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting bypass operation state to {state} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=state.map_to_api(),
-                    sub_feature="BypassStatus",
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=state.map_to_api(),
+                        sub_feature="BypassStatus"
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -631,19 +1022,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             speed: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting pump speed to {speed} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=speed,
-                    sub_feature="Setpoint",
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=speed,
+                        sub_feature="Setpoint"
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -653,19 +1047,22 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             backup_box_discharge_limit_percentage: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting backup box discharge limit percentage to {backup_box_discharge_limit_percentage} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    sub_feature="DischargeLimit",
-                    data=backup_box_discharge_limit_percentage,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=backup_box_discharge_limit_percentage,
+                        sub_feature="DischargeLimit"
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
@@ -675,30 +1072,167 @@ class Open3eMqttClient:
             hass: HomeAssistant,
             feature_id: int,
             maximum_recharge_power: float,
-            device_id: int
-    ):
+            device_id: int,
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
         try:
             _LOGGER.debug(f"Setting maximum recharge power to {maximum_recharge_power} of feature ID {feature_id}")
-            await mqtt.async_publish(
+            return await self.__async_publish_writes(
                 hass=hass,
-                topic=self.__mqtt_cmd,
-                payload=self.__write_json_payload(
-                    feature_id=feature_id,
-                    data=maximum_recharge_power,
-                    device_id=device_id
-                )
+                device_id=device_id,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=feature_id,
+                        data=maximum_recharge_power
+                    )
+                ],
+                force=force
             )
         except Exception as exception:
             raise Open3eError(exception)
         
 
     @staticmethod
-    def __write_json_payload(feature_id: int, data: any, device_id: int, sub_feature: str | None = None):
-        if sub_feature is None:
-            return json_dumps({"mode": "write", "addr": device_id, "data": [[feature_id, json_dumps(data)]]})
+    async def __async_request_until_answered(
+            request: Callable[[], Awaitable[Any]],
+            answered: asyncio.Event,
+            timeout: float,
+            received: asyncio.Event | None = None
+    ):
+        """
+        Publish a request and wait for its answer.
+        A fresh subscription only becomes active once the broker has processed it, so the first request
+        might be answered before the answer can be received. Instead of waiting a fixed time for the
+        subscription, the request is repeated with a growing interval until the first message of the
+        answer is received, which shows the subscription is active. Afterwards only the rest of the answer
+        is waited for, so requests answered in several messages are not sent to the bus again.
+        Raises asyncio.TimeoutError if no answer is received within the timeout.
+        """
+        received = received or answered
+        interval = MQTT_REQUEST_RETRY_INTERVAL
+
+        async with async_timeout.timeout(timeout):
+            while not received.is_set():
+                await request()
+
+                try:
+                    await asyncio.wait_for(received.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    interval *= 2
+
+            await answered.wait()
+
+    async def async_write(
+            self,
+            hass: HomeAssistant,
+            device_id: int,
+            writes: list[Open3eDataFeatureWrite],
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
+        """
+        Write several features and sub features of a device with a single Open3e command.
+        Writes of values that are already current are skipped unless forced.
+        Returns the writes which were published.
+        """
+        try:
+            _LOGGER.debug(f"Writing features {[write.feature_id for write in writes]} of device {device_id}")
+            return await self.__async_publish_writes(hass=hass, device_id=device_id, writes=writes, force=force)
+        except Exception as exception:
+            raise Open3eError(exception)
+
+    async def __async_publish_writes(
+            self,
+            hass: HomeAssistant,
+            device_id: int,
+            writes: list[Open3eDataFeatureWrite],
+            force: bool = False
+    ) -> list[Open3eDataFeatureWrite]:
+        """Publish the writes which are not current yet and return them."""
+        if not force:
+            writes = [write for write in writes if not self.__is_current(device_id, write)]
+
+        if not writes:
+            _LOGGER.debug(f"Skipping write to device {device_id}, the values are already current")
+            return []
+
+        # While queued, the latest payloads are about to be outdated, e.g. a switch turned on and directly
+        # off again must not skip the second write because the cache still reports off
+        keys = [(device_id, write.feature_id) for write in writes]
+        for key in keys:
+            self.__pending_writes[key] = self.__pending_writes.get(key, 0) + 1
+
+        try:
+            await self.__async_enqueue(
+                hass=hass,
+                device_id=device_id,
+                lane=Open3eLane.Write,
+                payload=self.__write_json_payload(writes=writes, device_id=device_id)
+            )
+
+            # Only published writes outdate the latest payloads, the next poll publishes the new ones
+            for key in keys:
+                self.__latest_payloads.pop(key, None)
+        finally:
+            for key in keys:
+                self.__pending_writes[key] -= 1
+                if not self.__pending_writes[key]:
+                    del self.__pending_writes[key]
+
+        return writes
+
+    def __is_current(self, device_id: int, write: Open3eDataFeatureWrite) -> bool:
+        """Check if the recent latest payload of the feature already has the value to write."""
+        key = (device_id, write.feature_id)
+        payload = self.__latest_payloads.get(key)
+        if payload is None or key in self.__pending_writes or not self.is_payload_fresh(*key):
+            return False
+
+        try:
+            current = payload.json
+        except ValueError:
+            return False
+
+        if write.sub_feature is not None:
+            if not isinstance(current, dict) or write.sub_feature not in current:
+                return False
+            current = current[write.sub_feature]
+
+        return Open3eMqttClient.__matches(current, write.data if write.current_if is None else write.current_if)
+
+    @staticmethod
+    def __matches(current: Any, expected: Any) -> bool:
+        """Check if a decoded value matches the expected one. Dictionaries only need to contain the expected keys."""
+        if isinstance(expected, dict):
+            return isinstance(current, dict) and all(
+                key in current and Open3eMqttClient.__matches(current[key], value)
+                for key, value in expected.items()
+            )
+
+        if (
+                isinstance(expected, (int, float)) and not isinstance(expected, bool)
+                and isinstance(current, (int, float)) and not isinstance(current, bool)
+        ):
+            return float(current) == float(expected)
+
+        return current == expected
+
+    @staticmethod
+    def __write_json_payload(writes: list[Open3eDataFeatureWrite], device_id: int):
+        return json_dumps({
+            "mode": "write",
+            "addr": device_id,
+            "data": [
+                [
+                    write.feature_id if write.sub_feature is None else f"{write.feature_id}.{write.sub_feature}",
+                    json_dumps(write.data)
+                ]
+                for write in writes
+            ]
+        })
 
-        return json_dumps(
-            {"mode": "write", "addr": device_id, "data": [[f"{feature_id}.{sub_feature}", json_dumps(data)]]})
+    @staticmethod
+    def __read_json_payload(device_id: int, feature_ids: list[int]):
+        return f'{{"mode": "read-json", "addr": "{device_id}", "data":[{",".join(map(str, feature_ids))}]}}'
 
     @staticmethod
     def __write_raw_payload(feature_id: int, data: str, device_id: int):
@@ -710,24 +1244,72 @@ class Open3eMqttClient:
             system_information: Open3eDataSystemInformation
     ):
         """
-        Subscribe to all device feature topics, request data, and populate device capabilities
-        when valid data is received. Invalid or unavailable values are skipped but still counted
-        toward completion.
+        Probe the capabilities of all devices concurrently.
+        A slow or silent device neither delays the probing of the other devices nor fails the setup.
+        """
+        semaphore = asyncio.Semaphore(CAPABILITY_PROBE_CONCURRENCY)
+
+        async def probe(device: Open3eDataDevice):
+            async with semaphore:
+                await self.__async_probe_device_capabilities(hass=hass, device=device)
+
+        results = await asyncio.gather(
+            *(probe(device) for device in system_information.devices),
+            return_exceptions=True
+        )
+
+        # A failing probe must not leave the probes of the other devices running unawaited
+        for device, result in zip(system_information.devices, results):
+            if isinstance(result, Exception):
+                device.capabilities_complete = False
+                _LOGGER.warning("Probing the capabilities of '%s' failed: %s", device.name, result)
+
+        _LOGGER.info("All device capabilities processed")
+
+    async def __async_probe_device_capabilities(
+            self,
+            hass: HomeAssistant,
+            device: Open3eDataDevice
+    ):
+        """
+        Subscribe to the capability feature topics of a device, request data, and populate the device
+        capabilities when valid data is received. Invalid or unavailable values are skipped but still
+        counted toward completion. If the device does not answer in time, it keeps the capabilities
+        received so far.
         """
+        # Find the capability device enum
+        capability_device = next(
+            (dev for dev in Open3eDevices if dev.display_name in device.name),
+            None
+        )
+        if not capability_device:
+            _LOGGER.debug("No capability device found for system device '%s'", device.name)
+            return
+
         event = asyncio.Event()
-        pending_features: dict[str, tuple[Open3eDataDeviceFeature, CapabilityFeature, Open3eDataDevice]] = {}
+        received = asyncio.Event()
+        pending_features: dict[str, tuple[Open3eDataDeviceFeature, CapabilityFeature]] = {}
+        feature_topics: dict[str, tuple[Open3eDataDeviceFeature, CapabilityFeature]] = {}
         subscriptions: list[Any] = []
 
         def message_callback(message: ReceiveMessage):
             topic = message.topic
             payload = message.payload
 
+            entry = feature_topics.get(topic)
+            if entry is not None:
+                hass.loop.call_soon_threadsafe(received.set)
+
+            if entry is not None and not self.__feature_subscription_active:
+                # Without the feature subscription of the coordinator, the probe has to answer the reads
+                hass.loop.call_soon_threadsafe(self.__resolve_feature_waiters, (device.id, entry[0].id))
+
             entry = pending_features.get(topic)
             if not entry:
-                _LOGGER.warning("Received message for unknown topic '%s'", topic)
+                _LOGGER.debug("Ignoring message for already processed or unknown topic '%s'", topic)
                 return
 
-            feature, cap_feature, device = entry
+            feature, cap_feature = entry
             del pending_features[topic]
 
             # Evaluate using the CapabilityFeature
@@ -746,58 +1328,52 @@ class Open3eMqttClient:
             if not pending_features:
                 hass.loop.call_soon_threadsafe(event.set)
 
+        async def request_pending_features():
+            await self.async_request_data(
+                hass=hass,
+                device_features={device.id: [feature.id for feature, _ in list(pending_features.values())]},
+                lane=Open3eLane.Confirmation
+            )
+
         try:
-            for device in system_information.devices:
-                # Find the capability device enum
-                capability_device = next(
-                    (dev for dev in Open3eDevices if dev.display_name in device.name),
-                    None
-                )
-                if not capability_device:
-                    _LOGGER.debug("No capability device found for system device '%s'", device.name)
+            for cap_feature in DEVICE_CAPABILITIES.get(capability_device, []):
+                feature_enum = cap_feature.feature
+                feature = device.features_by_id.get(feature_enum.id)
+                if feature is None:
+                    _LOGGER.warning(
+                        "Feature '%s' for capability '%s' not found in device '%s'",
+                        feature_enum.id, cap_feature.capability, device.name
+                    )
                     continue
 
-                device_features: list[Open3eDataDeviceFeature] = []
-
-                for cap_feature in DEVICE_CAPABILITIES.get(capability_device, []):
-                    feature_enum = cap_feature.feature
-                    feature = next((f for f in device.features if f.id == feature_enum.id), None)
-                    if feature is None:
-                        _LOGGER.warning(
-                            "Feature '%s' for capability '%s' not found in device '%s'",
-                            feature_enum.id, cap_feature.capability, device.name
-                        )
-                        continue
-
-                    device_features.append(feature)
-                    pending_features[feature.topic] = (feature, cap_feature, device)
-
-                    subscription = await mqtt.async_subscribe(
-                        hass=hass,
-                        topic=feature.topic,
-                        msg_callback=message_callback
-                    )
-                    subscriptions.append(subscription)
-
-                if device_features:
-                    # Give subscriptions time to be ready
-                    await asyncio.sleep(1)
-                    _LOGGER.debug(
-                        "Checking capabilities for device '%s'",
-                        device.name
-                    )
-                    await self.async_request_data(
-                        hass=hass,
-                        device_features={device.id: [f.id for f in device_features]}
-                    )
+                pending_features[feature.topic] = (feature, cap_feature)
+                feature_topics[feature.topic] = (feature, cap_feature)
+
+                subscription = await mqtt.async_subscribe(
+                    hass=hass,
+                    topic=feature.topic,
+                    msg_callback=message_callback
+                )
+                subscriptions.append(subscription)
 
-            if pending_features:
-                _LOGGER.debug("Waiting for all capabilities to be processed...")
-                await asyncio.wait_for(event.wait(), timeout=10)
-                _LOGGER.info("All device capabilities processed successfully")
+            if not pending_features:
+                return
+
+            _LOGGER.debug("Checking capabilities for device '%s'", device.name)
+            await self.__async_request_until_answered(
+                request=request_pending_features,
+                answered=event,
+                timeout=CAPABILITY_PROBE_TIMEOUT,
+                received=received
+            )
+            _LOGGER.debug("Capabilities of device '%s' processed successfully", device.name)
 
         except asyncio.TimeoutError:
-            raise Open3eServerTimeoutError()
+            device.capabilities_complete = False
+            _LOGGER.warning(
+                "Device '%s' did not report all capabilities in time; missing %s",
+                device.name, [cap_feature.capability for _, cap_feature in list(pending_features.values())]
+            )
         except Exception as exc:
             raise Open3eError(exc)
         finally:
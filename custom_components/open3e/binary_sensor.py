@@ -5,16 +5,19 @@ from __future__ import annotations
 from typing import Any, cast
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import Open3eDataUpdateCoordinator
 from .definitions.binary_sensors import BINARY_SENSORS, Open3eBinarySensorEntityDescription
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .entity import Open3eEntity
 from .ha_data import Open3eDataConfigEntry
 from .util import map_devices_to_entities
 
+BINARY_SENSOR_REGISTRY = Open3eEntityDescriptionRegistry(BINARY_SENSORS)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -23,7 +26,7 @@ async def async_setup_entry(
 ) -> None:
     device_binary_sensor_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        BINARY_SENSORS
+        BINARY_SENSOR_REGISTRY
     )
 
     for device, binary_sensors in device_binary_sensor_map.items():
@@ -53,10 +56,11 @@ class Open3eBinarySensor(Open3eEntity, BinarySensorEntity):
         """Return True if entity is available."""
         return self._attr_is_on is not None
 
-    async def async_on_data(self, feature_id: int) -> None:
+    @callback
+    def async_on_data(self, feature_id: int) -> None:
         """Handle updated data from MQTT."""
         self._attr_is_on = self.__transform_data(self.data[feature_id])
-        self.async_write_ha_state()
+        self.async_write_ha_state_on_change(self._attr_is_on)
 
     def __transform_data(self, data: Any):
         return self.entity_description.data_transform(data)
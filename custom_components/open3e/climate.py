@@ -6,20 +6,22 @@ from typing import Any, cast
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature, HVACMode, HVACAction
 from homeassistant.const import UnitOfTemperature, PRECISION_TENTHS, PRECISION_WHOLE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.json import json_loads
 
 from custom_components.open3e.definitions.subfeatures.program import Program
 from .const import VIESSMANN_TEMP_HEATING_MIN, VIESSMANN_TEMP_HEATING_MAX, VIESSMANN_UNAVAILABLE_VALUE
 from .coordinator import Open3eDataUpdateCoordinator
 from .definitions.climate import Open3eClimateEntityDescription, CLIMATE
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .definitions.subfeatures.hvac_mode import HvacMode
 from .entity import Open3eEntity
 from .ha_data import Open3eDataConfigEntry
 from .util import map_devices_to_entities
 
+CLIMATE_REGISTRY = Open3eEntityDescriptionRegistry(CLIMATE)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -28,7 +30,7 @@ async def async_setup_entry(
 ) -> None:
     device_climate_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        CLIMATE
+        CLIMATE_REGISTRY
     )
 
     for device, climates in device_climate_map.items():
@@ -140,11 +142,12 @@ class Open3eClimate(Open3eEntity, ClimateEntity):
             device=self.device
         )
 
-    async def async_on_data(self, feature_id: int):
+    @callback
+    def async_on_data(self, feature_id: int):
         """Handle updated data from MQTT."""
         match feature_id:
             case self.entity_description.hvac_mode_feature.id:
-                response = json_loads(self.data[feature_id])
+                response = self.data[feature_id].json
                 hvac_state = Program.from_operation_mode(response["State"]["ID"])
                 hvac_mode = HvacMode.from_api(int(response["Mode"]["ID"]))
 
@@ -159,7 +162,7 @@ class Open3eClimate(Open3eEntity, ClimateEntity):
                     self._attr_hvac_action = HVACAction.COOLING
 
             case self.entity_description.compressor_state_feature.id:
-                power_state = json_loads(self.data[feature_id])["PowerState"]
+                power_state = self.data[feature_id].json["PowerState"]
 
                 if self._attr_hvac_mode == HvacMode.Off:
                     self._attr_hvac_action = HVACAction.OFF
@@ -172,12 +175,19 @@ class Open3eClimate(Open3eEntity, ClimateEntity):
                         self._attr_hvac_action = HVACAction.COOLING
 
             case self.entity_description.flow_temperature_feature.id:
-                self.__current_flow_temperature = json_loads(self.data[feature_id])["Actual"]
+                self.__current_flow_temperature = self.data[feature_id].json["Actual"]
 
             case self.entity_description.room_temperature_feature.id:
-                self.__current_room_temperature = json_loads(self.data[feature_id])["Actual"]
+                self.__current_room_temperature = self.data[feature_id].json["Actual"]
 
             case self.entity_description.programs_temperature_feature.id:
-                self.__programs = json_loads(self.data[feature_id])
-
-        self.async_write_ha_state()
+                self.__programs = dict(self.data[feature_id].json)
+
+        self.async_write_ha_state_on_change(
+            self._attr_hvac_mode,
+            self._attr_hvac_action,
+            self.__current_program,
+            self.__current_flow_temperature,
+            self.__current_room_temperature,
+            self.target_temperature
+        )
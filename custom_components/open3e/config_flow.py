@@ -6,12 +6,14 @@ import logging
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .api import (
     Open3eMqttClient
 )
-from .const import DOMAIN, MQTT_CMD_KEY, MQTT_CMD_DEFAULT, MQTT_TOPIC_KEY, MQTT_TOPIC_DEFAULT
+from .const import DOMAIN, MQTT_CMD_KEY, MQTT_CMD_DEFAULT, MQTT_TOPIC_KEY, MQTT_TOPIC_DEFAULT, READS_PER_SECOND_KEY, \
+    READS_PER_SECOND_DEFAULT, ADAPTIVE_POLLING_KEY, ADAPTIVE_POLLING_DEFAULT
 from .errors import Open3eServerTimeoutError, Open3eServerUnavailableError, Open3eError
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +25,12 @@ class Open3eFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 3
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> Open3eOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return Open3eOptionsFlowHandler()
+
     async def async_step_user(
             self,
             user_input: dict | None = None,
@@ -71,3 +79,36 @@ class Open3eFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             }),
             errors=errors
         )
+
+
+class Open3eOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Open3e."""
+
+    async def async_step_init(
+            self,
+            user_input: dict | None = None,
+    ):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    READS_PER_SECOND_KEY,
+                    default=self.config_entry.options.get(READS_PER_SECOND_KEY, READS_PER_SECOND_DEFAULT),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=100,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Required(
+                    ADAPTIVE_POLLING_KEY,
+                    default=self.config_entry.options.get(ADAPTIVE_POLLING_KEY, ADAPTIVE_POLLING_DEFAULT),
+                ): selector.BooleanSelector()
+            })
+        )
@@ -9,6 +9,56 @@ MQTT_CMD_DEFAULT = "open3e/cmnd"
 MQTT_SYSTEM_TOPIC = "system"
 MQTT_SYSTEM_PAYLOAD = '{"mode":"system"}'
 
+READS_PER_SECOND_KEY = "reads_per_second"
+READS_PER_SECOND_DEFAULT = 10
+"""Default number of features Open3e is asked to read per second."""
+ADAPTIVE_POLLING_KEY = "adaptive_polling"
+ADAPTIVE_POLLING_DEFAULT = False
+"""If enabled, features whose value does not change are polled less often."""
+ADAPTIVE_POLLING_UNCHANGED_POLLS = 5
+"""Number of polls without a change before the refresh interval of a feature is doubled."""
+ADAPTIVE_POLLING_MAX_FACTOR = 8
+"""Maximum factor the refresh interval of an unchanged feature is stretched by."""
+
+NUMBER_WRITE_DEBOUNCE = 0.5
+"""Seconds to collect value changes of a number, e.g. while dragging a slider, before only the last one is written."""
+
+REFRESH_AFTER_WRITE_DELAY = 0.25
+"""Seconds to collect features to refresh after writes, so a burst of writes results in a single read per device."""
+
+ENTITY_STATE_WRITE_DELAY = 0.1
+"""Seconds to collect updates of entities with multiple features before their state is written once."""
+TEMPERATURE_DEADBAND = 0.1
+"""Kelvin a frequently polled temperature has to change by before its state is written again."""
+
+FAST_POLL_INTERVAL = 60
+"""Features with a refresh interval up to this many seconds are polled before features with longer intervals."""
+
+COORDINATOR_IDLE_INTERVAL = 5
+"""Seconds the coordinator waits for the next update if no feature is scheduled for polling."""
+
+COORDINATOR_MIN_INTERVAL = 1
+"""Minimum seconds between two coordinator updates, so features due at a similar time are requested together."""
+
+STORAGE_VERSION = 1
+"""Version of the stored system information cache."""
+
+MQTT_REQUEST_RETRY_INTERVAL = 1
+"""
+Initial seconds to wait for an answer before a request is published again while subscriptions become active.
+Long enough for the broker to settle a subscription and for Open3e to read several features from the bus.
+"""
+
+OPEN3E_READ_TIMEOUT = 5
+"""Seconds to wait for Open3e to publish the features of a read request."""
+DEVICE_MAX_READS_IN_FLIGHT = 2
+"""Number of read requests per device that may wait for their answer at the same time."""
+
+CAPABILITY_PROBE_CONCURRENCY = 4
+"""Number of devices whose capabilities are probed at the same time."""
+CAPABILITY_PROBE_TIMEOUT = 10
+"""Seconds to wait for a device to report its capabilities."""
+
 VIESSMANN_TEMP_HEATING_MIN = 3
 VIESSMANN_TEMP_HEATING_MAX = 37
 
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import time
-from dataclasses import dataclass
 from datetime import timedelta
+from typing import Any, Callable, Coroutine, Iterable
 
+from homeassistant.components.mqtt import ReceiveMessage
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceRegistry
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from custom_components.open3e.definitions.subfeatures.buffer import Buffer
@@ -17,16 +22,18 @@ from custom_components.open3e.definitions.subfeatures.dmw_mode import DmwMode
 from custom_components.open3e.definitions.subfeatures.hysteresis import Hysteresis
 from custom_components.open3e.definitions.subfeatures.program import Program
 from custom_components.open3e.definitions.subfeatures.smart_grid_temperature_offsets import SmartGridTemperatureOffsets
-from .api import Open3eMqttClient
-from .const import DOMAIN
-from .definitions.open3e_data import Open3eDataSystemInformation, Open3eDataDevice
+from .api import Open3eMqttClient, Open3eLane
+from .const import DOMAIN, STORAGE_VERSION, COORDINATOR_IDLE_INTERVAL, COORDINATOR_MIN_INTERVAL, \
+    ADAPTIVE_POLLING_UNCHANGED_POLLS, ADAPTIVE_POLLING_MAX_FACTOR, REFRESH_AFTER_WRITE_DELAY, FAST_POLL_INTERVAL
+from .definitions.open3e_data import Open3eDataSystemInformation, Open3eDataDevice, Open3eDataPayload, \
+    Open3eDataFeatureWrite
 from .definitions.subfeatures.buffer_mode import BufferMode
 from .definitions.subfeatures.dhw_hysteresis import DhwHysteresis
 from .definitions.subfeatures.heating_curve import HeatingCurve
 from .definitions.subfeatures.hvac_mode import HvacMode
 from .definitions.subfeatures.ventilation_mode import VentilationMode
 from .definitions.subfeatures.vitoair_quick_mode import VitoairQuickMode
-from .errors import Open3eCoordinatorUpdateFailed
+from .errors import Open3eCoordinatorUpdateFailed, Open3eServerTimeoutError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,13 +41,34 @@ from homeassistant.helpers import device_registry
 from .definitions.features import Feature
 
 
-@dataclass
+REFRESH_TOLERANCE = 0.5
+"""Seconds a feature may be refreshed early, so features due at nearly the same time share a request."""
+
+
 class CoordinatorEndpoint:
-    __last_refresh: float = -1
-    __entities_subscribed: int = 1
+    """Polling state of a (device, feature). Uses slots as there is one per polled feature."""
+    __slots__ = (
+        "refresh_interval",
+        "next_refresh",
+        "adaptive_factor",
+        "__entities_subscribed",
+        "__last_payload_hash",
+        "__unchanged_polls"
+    )
+
+    refresh_interval: int
+    next_refresh: float | None
+    """Monotonic time the endpoint is due next or None if it still waits for its first read."""
+    adaptive_factor: float
+    """Factor the refresh interval is stretched by while the value does not change."""
 
     def __init__(self, refresh_interval: int):
         self.refresh_interval = refresh_interval
+        self.next_refresh = None
+        self.adaptive_factor = 1
+        self.__entities_subscribed = 1
+        self.__last_payload_hash = None
+        self.__unchanged_polls = 0
 
     def add_entity_subscription(self):
         self.__entities_subscribed += 1
@@ -49,21 +77,58 @@ class CoordinatorEndpoint:
         self.__entities_subscribed -= 1
         return self.__entities_subscribed <= 0
 
-    def set_refresh_interval(self, refresh_interval):
-        if refresh_interval < self.refresh_interval:
-            self.refresh_interval = refresh_interval
+    def set_refresh_interval(self, refresh_interval) -> bool:
+        """Lower the refresh interval. Returns True if the next refresh moved to an earlier time."""
+        if refresh_interval >= self.refresh_interval:
+            return False
+
+        previous_refresh_interval = self.refresh_interval
+        self.refresh_interval = refresh_interval
+        if self.next_refresh is None:
+            return False
+
+        self.next_refresh -= previous_refresh_interval - refresh_interval
+        return True
+
+    def effective_refresh_interval(self, interval_factor: float = 1) -> float:
+        """Return the refresh interval stretched by the adaptive factor and the factor of the read budget."""
+        return self.refresh_interval * interval_factor * self.adaptive_factor
+
+    def update_last_refresh(self, now: float, interval_factor: float = 1):
+        self.next_refresh = now + self.effective_refresh_interval(interval_factor)
+
+    def observe_payload(self, payload: str | bytes) -> bool:
+        """
+        Adapt the refresh interval to how often the value changes.
+        The interval is doubled after several polls without a change and reset once the value changes.
+        Returns True if the interval was reset.
+        """
+        payload_hash = hash(payload)
+        if payload_hash != self.__last_payload_hash:
+            self.__last_payload_hash = payload_hash
+            self.__unchanged_polls = 0
+            if self.adaptive_factor == 1:
+                return False
+
+            self.adaptive_factor = 1
+            return True
+
+        self.__unchanged_polls += 1
+        if self.__unchanged_polls >= ADAPTIVE_POLLING_UNCHANGED_POLLS:
+            self.__unchanged_polls = 0
+            self.adaptive_factor = min(self.adaptive_factor * 2, ADAPTIVE_POLLING_MAX_FACTOR)
+
+        return False
 
-    def should_refresh(self, now: float):
-        return now - self.__last_refresh > self.refresh_interval - 0.5  # let's use a range so we can make sure it gets refreshed
 
-    def update_last_refresh(self, now: float):
-        self.__last_refresh = now
+FeatureListener = Callable[[int, Open3eDataPayload], None]
 
 
 class Open3eDataUpdateCoordinator(DataUpdateCoordinator):
     """
     Class to manage requesting for MQTT updates.
-    MQTT updates subscriptions are retrieved in the entities rather than in this class.
+    MQTT updates are received through a single wildcard subscription and dispatched to the
+    entities listening to the respective (device, feature).
     """
 
     __client: Open3eMqttClient
@@ -74,20 +139,71 @@ class Open3eDataUpdateCoordinator(DataUpdateCoordinator):
     __entry_id: str
 
     __endpoints: dict[tuple[int, int], CoordinatorEndpoint]
-
-    def __init__(self, hass, client: Open3eMqttClient, entry_id: str):
+    __schedule: list[tuple[float, tuple[int, int]]]
+    """
+    Heap of (next_refresh, (device_id, feature_id)) ordered by the time an endpoint is due.
+    Entries of removed or rescheduled endpoints are skipped when they are popped.
+    """
+    __next_update: float
+    __warm_up: list[tuple[int, tuple[int, int]]]
+    """
+    Heap of (refresh_interval, (device_id, feature_id)) of endpoints that were not polled yet.
+    They are requested within the reads per second budget, fast changing features first.
+    """
+    __demand: float
+    """Reads per second needed to poll all endpoints at their refresh interval."""
+    __interval_factor: float
+    """Factor the refresh intervals are stretched by if the demand exceeds the read budget."""
+    __last_update: float
+    __adaptive_polling: bool
+
+    __feature_topics: dict[str, tuple[int, int]]
+    """Maps the MQTT topic of a feature to its (device_id, feature_id)."""
+    __feature_listeners: dict[tuple[int, int], list[FeatureListener]]
+    __last_seen: dict[tuple[int, int], float]
+    """Time the last payload was received per (device_id, feature_id), even if it did not change."""
+    __subscriptions: list[Callable[[], None]]
+
+    __pending_refreshes: dict[int, tuple[Open3eDataDevice, set[int]]]
+    """Features to refresh after writes per device_id, read together once the refresh delay passed."""
+    __pending_refresh_handle: asyncio.TimerHandle | None
+    __read_tasks: set[asyncio.Task]
+    """Running polls and refreshes, cancelled on shutdown."""
+
+    __store: Store
+    """Caches the system information including device capabilities for fast restarts."""
+    __revalidation: asyncio.Task | None
+
+    def __init__(self, hass, client: Open3eMqttClient, entry_id: str, adaptive_polling: bool):
         super().__init__(
             hass,
             _LOGGER,
             name="Open3eDataUpdateCoordinator",
-            update_interval=timedelta(seconds=5),
+            update_interval=timedelta(seconds=COORDINATOR_IDLE_INTERVAL),
             always_update=True
         )
         self.__client = client
         self.__device_registry = device_registry.async_get(hass)
         self.__entry_id = entry_id
         self.__endpoints = {}
+        self.__schedule = []
+        self.__next_update = time.monotonic() + COORDINATOR_IDLE_INTERVAL
+        self.__warm_up = []
+        self.__demand = 0
+        self.__interval_factor = 1
+        self.__adaptive_polling = adaptive_polling
+        self.__last_update = time.monotonic()
         self.__server_available = None
+        self.__feature_topics = {}
+        self.__feature_listeners = {}
+        self.__last_seen = {}
+        self.__subscriptions = []
+        self.__pending_refreshes = {}
+        self.__pending_refresh_handle = None
+        self.__read_tasks = set()
+        self.__store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self.__revalidation = None
+        self.__client.is_payload_fresh = self.__is_payload_fresh
 
     async def _async_setup(self):
         """Set up the coordinator
@@ -99,12 +215,31 @@ class Open3eDataUpdateCoordinator(DataUpdateCoordinator):
         coordinator.async_config_entry_first_refresh.
         """
         await self.__client.async_check_availability(self.hass)
-        await self.__client.async_subscribe_to_availability(
-            hass=self.hass,
-            callback=self.__on_availability_update
+        self.__subscriptions.append(
+            await self.__client.async_subscribe_to_availability(
+                hass=self.hass,
+                callback=self.__on_availability_update
+            )
         )
 
-        self.system_information = await self.__client.async_get_system_information(self.hass)
+        cached_system_information = await self.__store.async_load()
+        if cached_system_information is not None:
+            _LOGGER.debug("Using cached system information, revalidating it in the background")
+            self.system_information = await self.hass.async_add_executor_job(
+                Open3eDataSystemInformation.from_dict,
+                cached_system_information
+            )
+            self.__revalidation = self.hass.async_create_background_task(
+                self.__async_revalidate_system_information(),
+                name="open3e revalidate system information"
+            )
+        else:
+            self.system_information = await self.__client.async_get_system_information(self.hass)
+            if all(device.capabilities_complete for device in self.system_information.devices):
+                await self.__store.async_save(self.system_information.to_dict())
+            else:
+                _LOGGER.debug("Not caching the system information, capabilities of some devices are missing")
+
         for device in self.system_information.devices:
 
             # Check if multiple devices have the same name
@@ -125,33 +260,280 @@ class Open3eDataUpdateCoordinator(DataUpdateCoordinator):
                 model=device.name,
             )
 
+        self.__feature_topics = {
+            feature.topic: (device.id, feature.id)
+            for device in self.system_information.devices
+            for feature in device.features
+        }
+        self.__subscriptions.append(
+            await self.__client.async_subscribe_to_features(
+                hass=self.hass,
+                callback=self.__on_feature_message
+            )
+        )
+
+    async def __async_revalidate_system_information(self):
+        """
+        Request the system information from Open3e and compare it to the cached one.
+        If devices, versions or capabilities changed, the cache is updated and the entry reloaded
+        so the entities match the system again.
+        Devices which did not report all capabilities in time are not trusted and keep their cached state.
+        """
+        try:
+            system_information = await self.__client.async_get_system_information(self.hass)
+        except HomeAssistantError as error:
+            _LOGGER.warning("Unable to revalidate the cached system information: %s", error)
+            return
+
+        cached_devices = {device.serial_number: device for device in self.system_information.devices}
+        devices: list[Open3eDataDevice] = []
+        for device in system_information.devices:
+            if device.capabilities_complete:
+                devices.append(device)
+                continue
+
+            cached_device = cached_devices.get(device.serial_number)
+            if cached_device is None:
+                _LOGGER.warning(
+                    "Capabilities of new device %s are incomplete, keeping the cached system information until "
+                    "the next start",
+                    device.name
+                )
+                return
+
+            _LOGGER.debug("Capabilities of device %s are incomplete, keeping its cached state", device.name)
+            devices.append(cached_device)
+
+        system_information = Open3eDataSystemInformation(devices)
+        data = system_information.to_dict()
+        if data == self.system_information.to_dict():
+            _LOGGER.debug("Cached system information is up to date")
+            return
+
+        _LOGGER.info("System information changed, reloading entities")
+        await self.__store.async_save(data)
+        self.hass.config_entries.async_schedule_reload(self.__entry_id)
+
+    async def async_shutdown(self) -> None:
+        """Cancel all MQTT subscriptions and background work of the coordinator."""
+        await super().async_shutdown()
+
+        if self.__revalidation is not None:
+            self.__revalidation.cancel()
+            self.__revalidation = None
+
+        if self.__pending_refresh_handle is not None:
+            self.__pending_refresh_handle.cancel()
+            self.__pending_refresh_handle = None
+        self.__pending_refreshes.clear()
+
+        for task in self.__read_tasks:
+            task.cancel()
+        self.__read_tasks.clear()
+
+        self.__client.async_shutdown()
+
+        for unsubscribe in self.__subscriptions:
+            unsubscribe()
+        self.__subscriptions.clear()
+
+    @callback
+    def __on_feature_message(self, message: ReceiveMessage):
+        """
+        Dispatch a message of the wildcard subscription to the listeners of its feature.
+        Runs in the event loop, so the message is handled without scheduling a job for it.
+        The payload is wrapped once, so it is decoded at most once for all listeners.
+        Listeners are only called if the raw payload differs from the last one of the feature.
+        """
+        key = self.__feature_topics.get(message.topic)
+        if key is None:
+            return
+
+        self.__last_seen[key] = time.time()
+        payload = self.__client.async_on_feature_data(*key, message.payload)
+
+        if self.__adaptive_polling:
+            self.__adapt_refresh_interval(key, message.payload)
+
+        if payload is None:
+            return
+
+        listeners = self.__feature_listeners.get(key)
+        if not listeners:
+            return
+
+        for listener in tuple(listeners):
+            try:
+                listener(key[1], payload)
+            except Exception:
+                _LOGGER.exception("Error handling message of topic '%s'", message.topic)
+
+    def __adapt_refresh_interval(self, key: tuple[int, int], payload: str | bytes):
+        """Poll a feature less often while its value does not change and at its refresh interval once it does."""
+        endpoint = self.__endpoints.get(key)
+        if endpoint is None or not endpoint.observe_payload(payload) or endpoint.next_refresh is None:
+            return
+
+        next_refresh = time.monotonic() + endpoint.refresh_interval * self.__interval_factor
+        if next_refresh < endpoint.next_refresh:
+            endpoint.next_refresh = next_refresh
+            self.__schedule_endpoint(key, endpoint)
+
+    @callback
+    def async_add_feature_listener(
+            self,
+            device: Open3eDataDevice,
+            feature_ids: Iterable[int],
+            listener: FeatureListener
+    ) -> Callable[[], None]:
+        """
+        Listen to MQTT updates of features of a device. Returns a callback to remove the listener.
+        Features that were already received are passed to the listener right away.
+        """
+        keys = [(device.id, feature_id) for feature_id in feature_ids]
+        for key in keys:
+            self.__feature_listeners.setdefault(key, []).append(listener)
+
+            payload = self.__client.latest_payload(*key)
+            if payload is not None:
+                self.hass.loop.call_soon(listener, key[1], payload)
+
+        @callback
+        def remove_listener():
+            for listener_key in keys:
+                listeners = self.__feature_listeners.get(listener_key)
+                if listeners is None:
+                    continue
+
+                listeners.remove(listener)
+                if not listeners:
+                    del self.__feature_listeners[listener_key]
+
+        return remove_listener
+
+    def __is_payload_fresh(self, device_id: int, feature_id: int) -> bool:
+        """Check if the feature was received within its effective refresh interval, so its payload can be trusted."""
+        key = (device_id, feature_id)
+        last_seen = self.__last_seen.get(key)
+        endpoint = self.__endpoints.get(key)
+        if last_seen is None or endpoint is None:
+            return False
+
+        refresh_interval = endpoint.effective_refresh_interval(self.__interval_factor)
+        return time.time() - last_seen <= refresh_interval + REFRESH_TOLERANCE
+
     def __on_availability_update(self, available: bool):
         self.__server_available = available
 
     async def _async_update_data(self) -> bool:
         """Update data."""
         if self.__server_available is None:
+            self.__set_next_update(COORDINATOR_IDLE_INTERVAL)
             return True
 
         if not self.__server_available:
+            self.__set_next_update(COORDINATOR_IDLE_INTERVAL)
             raise Open3eCoordinatorUpdateFailed()
 
-        now = time.time()
-        device_features: dict[int, list[int]] = {}
+        now = time.monotonic()
+        reads = 0
+        lane_device_features: dict[Open3eLane, dict[int, list[int]]] = {}
+
+        while self.__schedule and self.__schedule[0][0] <= now + REFRESH_TOLERANCE:
+            next_refresh, key = heapq.heappop(self.__schedule)
+            endpoint = self.__endpoints.get(key)
+            if endpoint is None or endpoint.next_refresh != next_refresh:
+                continue
+
+            self.__add_poll(lane_device_features, key, endpoint)
+            endpoint.update_last_refresh(now, self.__interval_factor)
+            heapq.heappush(self.__schedule, (endpoint.next_refresh, key))
+            reads += 1
+
+        # Spread the first reads of new endpoints, so Open3e is not flooded with every feature at once
+        elapsed = min(now - self.__last_update, COORDINATOR_MIN_INTERVAL)
+        budget = max(int(self.__client.read_budget.reads_per_second * elapsed), 1) - reads
+        self.__last_update = now
+
+        while self.__warm_up and budget > 0:
+            _, key = heapq.heappop(self.__warm_up)
+            endpoint = self.__endpoints.get(key)
+            if endpoint is None or endpoint.next_refresh is not None:
+                continue
+
+            self.__add_poll(lane_device_features, key, endpoint)
+            endpoint.update_last_refresh(now, self.__interval_factor)
+            heapq.heappush(self.__schedule, (endpoint.next_refresh, key))
+            budget -= 1
 
-        for (device_id, feature_id), endpoint in self.__endpoints.items():
-            if endpoint.should_refresh(now):
-                device_features.setdefault(device_id, []).append(feature_id)
-                endpoint.update_last_refresh(now)
+        if self.__warm_up:
+            self.__set_next_update(COORDINATOR_MIN_INTERVAL)
+        else:
+            self.__set_next_update(self.__seconds_until_next_refresh(now))
 
-        if not device_features:
+        if not lane_device_features:
             return True
 
-        _LOGGER.debug(f"Requesting data update for features {device_features}")
-        await self.__client.async_request_data(self.hass, device_features)
+        _LOGGER.debug(f"Requesting data update for features {lane_device_features}")
+        for lane, device_features in lane_device_features.items():
+            for device_id, feature_ids in device_features.items():
+                # Every device has its own queue, so the update does not wait for slow devices
+                self.__track_read_task(self.__async_poll(device_id, feature_ids, lane))
 
         return True
 
+    async def __async_poll(self, device_id: int, feature_ids: list[int], lane: Open3eLane):
+        try:
+            await self.__client.async_request_data(self.hass, {device_id: feature_ids}, lane)
+        except HomeAssistantError as error:
+            _LOGGER.warning("Polling features %s of device %s failed: %s", feature_ids, device_id, error)
+
+    @callback
+    def __track_read_task(self, coroutine: Coroutine[Any, Any, Any]):
+        task = self.hass.async_create_task(coroutine)
+        self.__read_tasks.add(task)
+        task.add_done_callback(self.__read_tasks.discard)
+
+    @staticmethod
+    def __add_poll(
+            lane_device_features: dict[Open3eLane, dict[int, list[int]]],
+            key: tuple[int, int],
+            endpoint: CoordinatorEndpoint
+    ):
+        """Add a due endpoint to the polls, fast changing features are polled with a higher priority."""
+        lane = Open3eLane.FastPoll if endpoint.refresh_interval <= FAST_POLL_INTERVAL else Open3eLane.SlowPoll
+        lane_device_features.setdefault(lane, {}).setdefault(key[0], []).append(key[1])
+
+    def __seconds_until_next_refresh(self, now: float) -> float:
+        """Return the seconds until the earliest endpoint is due, dropping outdated schedule entries."""
+        while self.__schedule:
+            next_refresh, key = self.__schedule[0]
+            endpoint = self.__endpoints.get(key)
+            if endpoint is not None and endpoint.next_refresh == next_refresh:
+                return max(next_refresh - now, COORDINATOR_MIN_INTERVAL)
+
+            heapq.heappop(self.__schedule)
+
+        return COORDINATOR_IDLE_INTERVAL
+
+    def __set_next_update(self, seconds: float):
+        """Let the coordinator sleep until the next update is due."""
+        self.__next_update = time.monotonic() + seconds
+        self.update_interval = timedelta(seconds=seconds)
+
+    def __schedule_endpoint(self, key: tuple[int, int], endpoint: CoordinatorEndpoint):
+        """Add an endpoint to the schedule and wake up the coordinator earlier if needed."""
+        heapq.heappush(self.__schedule, (endpoint.next_refresh, key))
+        self.__wake_up_at(endpoint.next_refresh)
+
+    def __wake_up_at(self, due: float):
+        """Wake up the coordinator earlier if something is due before the planned update."""
+        if due < self.__next_update - COORDINATOR_MIN_INTERVAL:
+            # Wait a moment so all endpoints of entities being added together are requested at once
+            self.__set_next_update(COORDINATOR_MIN_INTERVAL)
+            if self._listeners:
+                self._schedule_refresh()
+
     async def on_entity_added(self, features: list[Feature], device: Open3eDataDevice):
         """Called when an entity is added."""
         for feature in features:
@@ -161,9 +543,15 @@ class Open3eDataUpdateCoordinator(DataUpdateCoordinator):
                 self.__endpoints[key] = CoordinatorEndpoint(
                     refresh_interval=feature.refresh_interval
                 )
+                heapq.heappush(self.__warm_up, (feature.refresh_interval, key))
+                self.__wake_up_at(time.monotonic())
+                self.__update_demand(1 / feature.refresh_interval)
             else:
                 endpoint.add_entity_subscription()
-                endpoint.set_refresh_interval(feature.refresh_interval)
+                refresh_interval = endpoint.refresh_interval
+                if endpoint.set_refresh_interval(feature.refresh_interval):
+                    self.__schedule_endpoint(key, endpoint)
+                self.__update_demand(1 / endpoint.refresh_interval - 1 / refresh_interval)
 
     def on_entity_removed(self, features: list[Feature], device: Open3eDataDevice):
         """Called when an entity is removed."""
@@ -173,373 +561,517 @@ class Open3eDataUpdateCoordinator(DataUpdateCoordinator):
             endpoint = self.__endpoints.get(key)
             if endpoint and endpoint.remove_entity_subscription():
                 del self.__endpoints[key]
+                self.__update_demand(-1 / endpoint.refresh_interval)
+
+    def __update_demand(self, change: float):
+        """
+        Track the reads per second needed by all endpoints.
+        If they exceed the read budget, all refresh intervals are stretched proportionally
+        instead of queueing reads on the Open3e server.
+        """
+        self.__demand = max(self.__demand + change, 0)
+        interval_factor = max(self.__demand / self.__client.read_budget.reads_per_second, 1)
+
+        if interval_factor > 1 and self.__interval_factor == 1:
+            _LOGGER.warning(
+                "Polling needs %.1f reads per second, which exceeds the budget of %s. "
+                "Refresh intervals are stretched by a factor of %.2f",
+                self.__demand,
+                self.__client.read_budget.reads_per_second,
+                interval_factor
+            )
+        elif interval_factor == 1 and self.__interval_factor > 1:
+            _LOGGER.info("Polling fits the read budget again, using the configured refresh intervals")
+
+        self.__interval_factor = interval_factor
 
     def get_mqtt_topics_for_features(self, features: list[Feature], device: Open3eDataDevice):
         """Return MQTT topics matching a list of features for a device."""
         return [
-            mqtt_topic for feature in features
-            for mqtt_topic in device.features
-            if mqtt_topic.id == feature.id
+            device.features_by_id[feature.id] for feature in features
+            if feature.id in device.features_by_id
         ]
 
+    async def async_write_features(
+            self,
+            device: Open3eDataDevice,
+            writes: list[Open3eDataFeatureWrite],
+            force: bool = False
+    ):
+        """
+        Write several features of a device with a single command and refresh them afterwards.
+        Writes of values that are already current are skipped unless forced.
+        """
+        written = await self.__client.async_write(
+            hass=self.hass,
+            device_id=device.id,
+            writes=writes,
+            force=force
+        )
+
+        if written:
+            self.async_refresh_feature(device, list(dict.fromkeys(write.feature_id for write in written)))
+
     async def async_set_program_temperature(
             self,
             set_programs_feature_id: int,
             program: Program,
             temperature: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_program_temperature(
+        written = await self.__client.async_set_program_temperature(
             hass=self.hass,
             set_programs_feature_id=set_programs_feature_id,
             program=program,
             temperature=temperature,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [set_programs_feature_id])
+        if written:
+            self.async_refresh_feature(device, [set_programs_feature_id])
 
     async def async_set_program_temperature_cooling(
             self,
             set_programs_feature_id: int,
             program: Program,
             temperature: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_program_temperature_cooling(
+        written = await self.__client.async_set_program_temperature_cooling(
             hass=self.hass,
             set_programs_feature_id=set_programs_feature_id,
             program=program,
             temperature=temperature,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [set_programs_feature_id])
+        if written:
+            self.async_refresh_feature(device, [set_programs_feature_id])
 
     async def async_set_hot_water_temperature(
             self,
             feature_id: int,
             temperature: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_hot_water_temperature(
+        written = await self.__client.async_set_hot_water_temperature(
             hass=self.hass,
             feature_id=feature_id,
             temperature=temperature,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
-    async def async_set_hvac_mode(self, mode: HvacMode, hvac_mode_feature_id: int, device: Open3eDataDevice):
-        await self.__client.async_set_hvac_mode(self.hass, mode, hvac_mode_feature_id, device.id)
-        # Wait for 4 seconds to request hvac mode
-        # this takes a bit longer hence the longer wait time
+    async def async_set_hvac_mode(
+            self,
+            mode: HvacMode,
+            hvac_mode_feature_id: int,
+            device: Open3eDataDevice,
+            force: bool = False
+    ):
+        written = await self.__client.async_set_hvac_mode(self.hass, mode, hvac_mode_feature_id, device.id, force)
 
-        self.async_refresh_feature(device, [hvac_mode_feature_id])
+        if written:
+            self.async_refresh_feature(device, [hvac_mode_feature_id])
 
     async def async_set_hot_water_mode(
             self,
             mode: DmwMode,
             dmw_state_feature_id: int,
             dmw_efficiency_mode_feature_id: int,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_dmw_mode(
+        written = await self.__client.async_set_dmw_mode(
             hass=self.hass,
             mode=mode,
             dmw_state_feature_id=dmw_state_feature_id,
             dmw_efficiency_mode_feature_id=dmw_efficiency_mode_feature_id,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [dmw_state_feature_id, dmw_efficiency_mode_feature_id])
+        if written:
+            self.async_refresh_feature(device, [dmw_state_feature_id, dmw_efficiency_mode_feature_id])
 
     async def async_set_max_power_electrical_heater(
             self,
             feature_id: int,
             max_power: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_max_power_electrical_heater(
+        written = await self.__client.async_set_max_power_electrical_heater(
             hass=self.hass,
             feature_id=feature_id,
             max_power=max_power,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_smart_grid_temperature_offset(
             self,
             feature_id: int,
             offset: SmartGridTemperatureOffsets,
             value: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_smart_grid_temperature_offset(
+        written = await self.__client.async_set_smart_grid_temperature_offset(
             hass=self.hass,
             feature_id=feature_id,
             offset=offset,
             value=value,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_temperature_cooling(
             self,
             feature_id: int,
             value: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_temperature_cooling(
+        written = await self.__client.async_set_temperature_cooling(
             hass=self.hass,
             feature_id=feature_id,
             value=value,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_hysteresis(
             self,
             feature_id: int,
             hysteresis: Hysteresis,
             value: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_hysteresis(
+        written = await self.__client.async_set_hysteresis(
             hass=self.hass,
             feature_id=feature_id,
             hysteresis=hysteresis,
             value=value,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_buffer_temperature(
             self,
             feature_id: int,
             buffer: Buffer,
             value: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_buffer_temperature(
+        written = await self.__client.async_set_buffer_temperature(
             hass=self.hass,
             feature_id=feature_id,
             buffer=buffer,
             value=value,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_frost_protection_temperature(
             self,
             feature_id: int,
             value: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_frost_protection_temperature(
+        written = await self.__client.async_set_frost_protection_temperature(
             hass=self.hass,
             feature_id=feature_id,
             value=value,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_heating_curve(
             self,
             feature_id: int,
             heating_curve: HeatingCurve,
             value: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_heating_curve(
+        written = await self.__client.async_set_heating_curve(
             hass=self.hass,
             feature_id=feature_id,
             heating_curve=heating_curve,
             value=value,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_dhw_hysteresis(
             self,
             feature_id: int,
             hysteresis: DhwHysteresis,
             value: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_dhw_hysteresis(
+        written = await self.__client.async_set_dhw_hysteresis(
             hass=self.hass,
             feature_id=feature_id,
             hysteresis=hysteresis,
             value=value,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_buffer_mode(
             self,
             feature_id: int,
             mode: BufferMode,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_buffer_mode(
+        written = await self.__client.async_set_buffer_mode(
             hass=self.hass,
             feature_id=feature_id,
             mode=mode,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_hot_water_quickmode(
             self,
             feature_id: int,
             is_on: bool,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_hot_water_quickmode(
+        written = await self.__client.async_set_hot_water_quickmode(
             hass=self.hass,
             feature_id=feature_id,
             is_on=is_on,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_vitoair_quick_mode(
             self,
             refresh_feature_id: int,
             set_feature_id: int,
             mode: VitoairQuickMode,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_vitoair_quick_mode(
+        written = await self.__client.async_set_vitoair_quick_mode(
             hass=self.hass,
             feature_id=set_feature_id,
             mode=mode,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [refresh_feature_id])
+        if written:
+            self.async_refresh_feature(device, [refresh_feature_id])
 
     async def async_set_hot_water_circulation_pump(
             self,
             feature_id: int,
             is_on: bool,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_hot_water_circulation_pump(
+        written = await self.__client.async_set_hot_water_circulation_pump(
             hass=self.hass,
             feature_id=feature_id,
             is_on=is_on,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_ventilation_level(
             self,
             feature_id: int,
             level: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_ventilation_level(
+        written = await self.__client.async_set_ventilation_level(
             hass=self.hass,
             feature_id=feature_id,
             level=level,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_ventilation_mode(
             self,
             feature_id: int,
             mode: VentilationMode,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_ventilation_mode(
+        written = await self.__client.async_set_ventilation_mode(
             hass=self.hass,
             feature_id=feature_id,
             mode=mode,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_bypass_operation_state(
             self,
             feature_id: int,
             state: BypassOperationState,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_bypass_operation_state(
+        written = await self.__client.async_set_bypass_operation_state(
             hass=self.hass,
             feature_id=feature_id,
             state=state,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
 
     async def async_set_circuit_pump_speed(
             self,
             feature_id: int,
             speed: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_circuit_pump_speed(
+        written = await self.__client.async_set_circuit_pump_speed(
             hass=self.hass,
             feature_id=feature_id,
             speed=speed,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
         
     async def async_set_backup_box_discharge_limit_percentage(
             self,
             feature_id: int,
             backup_box_discharge_limit_percentage: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_backup_box_discharge_limit_percentage(
+        written = await self.__client.async_set_backup_box_discharge_limit_percentage(
             hass=self.hass,
             feature_id=feature_id,
             backup_box_discharge_limit_percentage=backup_box_discharge_limit_percentage,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
         
     async def async_set_maximum_recharge_power(
             self,
             feature_id: int,
             maximum_recharge_power: float,
-            device: Open3eDataDevice
+            device: Open3eDataDevice,
+            force: bool = False
     ):
-        await self.__client.async_set_maximum_recharge_power(
+        written = await self.__client.async_set_maximum_recharge_power(
             hass=self.hass,
             feature_id=feature_id,
             maximum_recharge_power=maximum_recharge_power,
-            device_id=device.id
+            device_id=device.id,
+            force=force
         )
 
-        self.async_refresh_feature(device, [feature_id])
+        if written:
+            self.async_refresh_feature(device, [feature_id])
     
+    async def async_read_features(self, device: Open3eDataDevice, feature_ids: list[int]) -> bool:
+        """
+        Read features of a device and wait until Open3e has published them.
+        Returns False if Open3e did not answer in time.
+        """
+        try:
+            await self.__client.async_read(self.hass, device.id, feature_ids)
+            return True
+        except Open3eServerTimeoutError:
+            _LOGGER.warning("Reading features %s of '%s' timed out", feature_ids, device.name)
+            return False
+
+    @callback
     def async_refresh_feature(self, device: Open3eDataDevice, feature_ids: list[int]):
-        async def delayed_refresh():
-            # Wait for 2 seconds to request new states
-            await asyncio.sleep(2)
-            await self.__client.async_request_data(self.hass, {device.id: feature_ids})
+        """
+        Refresh features after a write.
+        Refreshes requested within a short delay are merged, so each device is read once with all its features.
+        The delay does not wait for the device, the read is queued behind the write and only completed
+        by answers published after it.
+        """
+        _, pending_feature_ids = self.__pending_refreshes.setdefault(device.id, (device, set()))
+        pending_feature_ids.update(feature_ids)
+
+        if self.__pending_refresh_handle is None:
+            self.__pending_refresh_handle = self.hass.loop.call_later(
+                REFRESH_AFTER_WRITE_DELAY,
+                self.__start_pending_refreshes
+            )
+
+    @callback
+    def __start_pending_refreshes(self):
+        self.__pending_refresh_handle = None
+        pending_refreshes = self.__pending_refreshes
+        self.__pending_refreshes = {}
 
-        asyncio.create_task(delayed_refresh())
+        for device, feature_ids in pending_refreshes.values():
+            # Open3e handles commands in order, hence the read is answered after the preceding write
+            self.__track_read_task(self.async_read_features(device, sorted(feature_ids)))
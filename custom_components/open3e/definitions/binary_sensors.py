@@ -2,11 +2,11 @@ from dataclasses import dataclass
 from typing import Callable, Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntityDescription, BinarySensorDeviceClass
-from homeassistant.util.json import json_loads
 
 from .devices import Open3eDevices
 from .entity_description import Open3eEntityDescription
 from .features import Features
+from .open3e_data import Open3eDataPayload
 from .subfeatures.domestic_hot_water_operation_state import is_domestic_hot_water_operation_state_active
 from ..capability.capability import Capability
 
@@ -14,18 +14,18 @@ from ..capability.capability import Capability
 class BinarySensorDataTransform:
     """Data transform functions for MQTT binary on/off state."""
 
-    POWERSTATE = lambda data: json_loads(data)["PowerState"] > 0
+    POWERSTATE = lambda data: data.json["PowerState"] > 0
     POWERSTATE_COMPLEX = lambda data: (
-        json_loads(data)["PowerState"]["ID"] > 0
-        if isinstance(json_loads(data)["PowerState"], dict)
-        else json_loads(data)["PowerState"] > 0
+        data.json["PowerState"]["ID"] > 0
+        if isinstance(data.json["PowerState"], dict)
+        else data.json["PowerState"] > 0
     )
-    STATE = lambda data: json_loads(data)["State"] > 0
-    HYGIENE_ACTIVE = lambda data: json_loads(data)["HygenieActive"] > 0
-    BACKUP_BOX_INSTALLED = lambda data: json_loads(data)[
+    STATE = lambda data: data.json["State"] > 0
+    HYGIENE_ACTIVE = lambda data: data.json["HygenieActive"] > 0
+    BACKUP_BOX_INSTALLED = lambda data: data.json[
                                             "Unknown"] > 0  # TODO: Needs to be renamed when open3e is updated to BackUpBoxInstalled
-    HEX_ON = lambda data: data != "000000"  # on
-    RAW = lambda data: data
+    HEX_ON = lambda data: data.raw != "000000"  # on
+    RAW = lambda data: data.raw
     """The data state represents a raw value without any encapsulation."""
 
 
@@ -35,7 +35,7 @@ class Open3eBinarySensorEntityDescription(
 ):
     """Default binary sensor entity description for open3e."""
     domain: str = "binary_sensor"
-    data_transform: Callable[[Any], Any] | None = None
+    data_transform: Callable[[Open3eDataPayload], Any] | None = None
 
 
 BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
@@ -97,7 +97,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         key="malfunction_heating_unit_blocked",
         translation_key="malfunction_heating_unit_blocked",
         entity_registry_enabled_default=False,
-        data_transform=lambda data: int(data) > 0,
+        data_transform=lambda data: int(data.raw) > 0,
         required_device=Open3eDevices.Vitodens
     ),
     Open3eBinarySensorEntityDescription(
@@ -107,7 +107,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         key="mixer_one_circuit_operation_state",
         translation_key="mixer_one_circuit_operation_state",
         entity_registry_enabled_default=False,
-        data_transform=lambda data: int(json_loads(data)["State"]["ID"]) < 255,
+        data_transform=lambda data: int(data.json["State"]["ID"]) < 255,
         required_capabilities=[Capability.Circuit1],
         required_device=Open3eDevices.Vitodens
     ),
@@ -118,7 +118,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         key="mixer_two_circuit_operation_state",
         translation_key="mixer_two_circuit_operation_state",
         entity_registry_enabled_default=False,
-        data_transform=lambda data: int(json_loads(data)["State"]["ID"]) < 255,
+        data_transform=lambda data: int(data.json["State"]["ID"]) < 255,
         required_capabilities=[Capability.Circuit2],
         required_device=Open3eDevices.Vitodens
     ),
@@ -129,7 +129,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         key="mixer_three_circuit_operation_state",
         translation_key="mixer_three_circuit_operation_state",
         entity_registry_enabled_default=False,
-        data_transform=lambda data: int(json_loads(data)["State"]["ID"]) < 255,
+        data_transform=lambda data: int(data.json["State"]["ID"]) < 255,
         required_capabilities=[Capability.Circuit3],
         required_device=Open3eDevices.Vitodens
     ),
@@ -140,7 +140,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         key="mixer_four_circuit_operation_state",
         translation_key="mixer_four_circuit_operation_state",
         entity_registry_enabled_default=False,
-        data_transform=lambda data: int(json_loads(data)["State"]["ID"]) < 255,
+        data_transform=lambda data: int(data.json["State"]["ID"]) < 255,
         required_capabilities=[Capability.Circuit4],
         required_device=Open3eDevices.Vitodens
     ),
@@ -242,7 +242,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         key="external_lock_active",
         translation_key="external_lock_active",
         icon="mdi:lock",
-        data_transform=lambda data: int(data) > 0,
+        data_transform=lambda data: int(data.raw) > 0,
         required_device=Open3eDevices.Vitocal
     ),
 
@@ -253,7 +253,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         key="heat_pump_frost_protection",
         translation_key="heat_pump_frost_protection",
         icon="mdi:snowflake-melt",
-        data_transform=lambda data: int(data) > 0,
+        data_transform=lambda data: int(data.raw) > 0,
         required_device=Open3eDevices.Vitocal
     ),
 
@@ -290,7 +290,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         icon="mdi:air-filter",
         key="ventilation_outside_air_bypass",
         translation_key="ventilation_outside_air_bypass",
-        data_transform=lambda data: int(data) > 0,
+        data_transform=lambda data: int(data.raw) > 0,
         required_device=Open3eDevices.Vitoair
     ),
     Open3eBinarySensorEntityDescription(
@@ -299,7 +299,7 @@ BINARY_SENSORS: tuple[Open3eBinarySensorEntityDescription, ...] = (
         icon="mdi:air-filter",
         key="ventilation_inside_air_bypass",
         translation_key="ventilation_inside_air_bypass",
-        data_transform=lambda data: int(data) > 0,
+        data_transform=lambda data: int(data.raw) > 0,
         required_device=Open3eDevices.Vitoair
     ),
 )
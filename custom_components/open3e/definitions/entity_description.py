@@ -1,9 +1,11 @@
 from dataclasses import dataclass
+from typing import Iterable
 
 from homeassistant.helpers.entity import EntityDescription
 
 from .devices import Device
 from .features import Feature
+from .open3e_data import Open3eDataDevice
 from ..capability.capability import Capability
 
 
@@ -17,3 +19,46 @@ class Open3eEntityDescription(EntityDescription):
     """Defines which device this requires. Some features can be used for multiple devices such as TargetQuickMode."""
     required_capabilities: list[Capability] | None = None
     """Defines which capabilities this requires. Some devices have optional features, such as multiple circuits on the Vitocal."""
+    deadband: float | None = None
+    """Numeric changes smaller than the deadband do not update the state, e.g. 0.1 for temperatures."""
+
+
+class Open3eEntityDescriptionRegistry:
+    """
+    Index of entity descriptions to find the descriptions matching a device.
+    Descriptions are indexed by their required device and one of their features, so only descriptions
+    whose indexed feature is available on a device have to be checked completely.
+    """
+
+    __index: dict[tuple[str | None, int | None], list[tuple[int, Open3eEntityDescription, frozenset[int], frozenset[Capability]]]]
+    """Maps (required device name, feature id) to (position, description, feature ids, capabilities)."""
+
+    def __init__(self, descriptions: Iterable[Open3eEntityDescription]):
+        self.__index = {}
+
+        for position, description in enumerate(descriptions):
+            feature_ids = frozenset(feature.id for feature in description.poll_data_features or ())
+            capabilities = frozenset(description.required_capabilities or ())
+            device_name = description.required_device.display_name if description.required_device else None
+            feature_id = min(feature_ids) if feature_ids else None
+
+            self.__index.setdefault((device_name, feature_id), []).append(
+                (position, description, feature_ids, capabilities)
+            )
+
+    def descriptions_for_device(self, device: Open3eDataDevice) -> list[Open3eEntityDescription]:
+        """
+        Return the descriptions whose poll_data_features are all available on the device,
+        whose required capabilities the device has and whose required_device matches, in registration order.
+        """
+        device_feature_ids = device.features_by_id.keys()
+        matches: list[tuple[int, Open3eEntityDescription]] = []
+
+        for device_name in (None, device.name):
+            for feature_id in (None, *device_feature_ids):
+                for position, description, feature_ids, capabilities in self.__index.get((device_name, feature_id), ()):
+                    if device_feature_ids >= feature_ids and capabilities <= device.capabilities:
+                        matches.append((position, description))
+
+        matches.sort(key=lambda match: match[0])
+        return [description for _, description in matches]
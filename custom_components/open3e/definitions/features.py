@@ -315,3 +315,11 @@ class Features:
         NoiseReductionMode = Feature(id=2634, refresh_interval=300)
         MixerOneCircuitFrostProtectionConfiguration = Feature(id=2855, refresh_interval=300)
         MixerTwoCircuitFrostProtectionConfiguration = Feature(id=2856, refresh_interval=300)
+
+
+FEATURE_CATALOG_IDS: frozenset[int] = frozenset(
+    feature.id
+    for category in vars(Features).values() if isinstance(category, type)
+    for feature in vars(category).values() if isinstance(feature, Feature)
+)
+"""IDs of all features in the catalog. Features outside of it are never used and dropped during discovery."""
@@ -1,29 +1,111 @@
 """Types for open3e"""
+import logging
 from dataclasses import dataclass
 from typing import Any
 
+from homeassistant.util.json import json_loads
+
 from .devices import Open3eDevices
+from .features import FEATURE_CATALOG_IDS
 from ..capability.capability import Capability
 
+_LOGGER = logging.getLogger(__name__)
+
+_UNDECODED = object()
+
+
+class Open3eDataPayload:
+    """
+    Payload of a feature message.
+    It is decoded at most once and shared between all consumers of the feature.
+    """
+    __slots__ = ("raw", "__json")
+
+    raw: str
+    """The payload as received from MQTT."""
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.__json = _UNDECODED
+
+    @property
+    def json(self) -> Any:
+        """The JSON decoded payload. Decoding happens on first access."""
+        if self.__json is _UNDECODED:
+            self.__json = json_loads(self.raw)
+
+        return self.__json
+
 
 @dataclass(frozen=True)
+class Open3eDataFeatureWrite:
+    """Value to write to a feature or one of its sub features."""
+    feature_id: int
+    data: Any
+    sub_feature: str | None = None
+    current_if: Any = None
+    """Part of the decoded value which means the feature already has the value to write. Defaults to data."""
+
+
 class Open3eDataDeviceFeature:
+    """Feature of a device. Devices report many features, so it only holds slots for its id and topic."""
+    __slots__ = ("id", "topic")
+
     id: int
     topic: str
 
+    def __init__(self, id: int, topic: str):
+        self.id = id
+        self.topic = topic
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Open3eDataDeviceFeature):
+            return NotImplemented
+
+        return self.id == other.id and self.topic == other.topic
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.topic))
+
+    def __repr__(self) -> str:
+        return f"Open3eDataDeviceFeature(id={self.id}, topic={self.topic!r})"
+
     @staticmethod
     def from_dict(data: dict[str, Any]):
-        return Open3eDataDeviceFeature(data.pop("id"), data.pop("topic"))
+        return Open3eDataDeviceFeature(data["id"], data["topic"])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.id, "topic": self.topic}
 
 
 class Open3eDataDevice:
+    __slots__ = (
+        "id",
+        "name",
+        "serial_number",
+        "software_version",
+        "hardware_version",
+        "features",
+        "features_by_id",
+        "manufacturer",
+        "capabilities",
+        "capabilities_complete",
+        "unknown_feature_count"
+    )
+
     id: int
     name: str
     serial_number: str
     software_version: str | None
     hardware_version: str | None
     features: tuple[Open3eDataDeviceFeature, ...]
+    features_by_id: dict[int, Open3eDataDeviceFeature]
+    """Index of the features by their id."""
     capabilities: set[Capability]
+    capabilities_complete: bool
+    """False if the device did not report all capability features in time, so capabilities may be missing."""
+    unknown_feature_count: int
+    """Number of features reported by Open3e which are not in the feature catalog and were dropped."""
 
     def __init__(
             self,
@@ -32,7 +114,8 @@ class Open3eDataDevice:
             serial_number: str,
             software_version: str,
             hardware_version: str,
-            features: tuple[Open3eDataDeviceFeature, ...]
+            features: tuple[Open3eDataDeviceFeature, ...],
+            unknown_feature_count: int = 0
     ):
         self.id = id
         self.name = name
@@ -40,35 +123,72 @@ class Open3eDataDevice:
         self.software_version = software_version
         self.hardware_version = hardware_version
         self.features = features
+        self.features_by_id = {feature.id: feature for feature in features}
         self.manufacturer = "Viessmann"
         self.capabilities = set()
+        self.capabilities_complete = True
+        self.unknown_feature_count = unknown_feature_count
 
     @staticmethod
     def from_dict(data: dict[str, Any]):
-        name = data.pop("name")
+        name = data["name"]
 
-        device = next((dev for dev in Open3eDevices if dev.id in name), None)
+        # Open3e reports the ECU name, e.g. HPMU, while cached devices are stored with their display name
+        device = next((dev for dev in Open3eDevices if dev.id in name or dev.display_name == name), None)
 
         if device is None:
             return None
 
-        features_dict = data.pop("features")
+        # Only features of the catalog are ever used, the rest is counted for diagnostics
+        reported_features_dict = data["features"]
+        features_dict = [
+            feature_dict for feature_dict in reported_features_dict
+            if feature_dict["id"] in FEATURE_CATALOG_IDS
+        ]
+        unknown_feature_count = data.get("unknown_feature_count", 0) + len(reported_features_dict) - len(features_dict)
+
         features = tuple(
             Open3eDataDeviceFeature.from_dict(feature_dict)
             for feature_dict in features_dict
         )
 
         device = Open3eDataDevice(
-            id=data.pop("id"),
+            id=data["id"],
             name=device.display_name,
-            serial_number=data.pop("serial_number"),
-            software_version=data.pop("software_version"),
-            hardware_version=data.pop("hardware_version"),
-            features=features
+            serial_number=data["serial_number"],
+            software_version=data["software_version"],
+            hardware_version=data["hardware_version"],
+            features=features,
+            unknown_feature_count=unknown_feature_count
         )
 
+        if unknown_feature_count:
+            _LOGGER.debug(
+                "Device %s reports %s features which are not in the catalog",
+                device.name,
+                unknown_feature_count
+            )
+
+        # Only present for cached devices, Open3e does not report capabilities
+        for capability in data.get("capabilities", []):
+            if capability in Capability.__members__:
+                device.capabilities.add(Capability[capability])
+
         return device
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the device so it can be restored with from_dict, including its capabilities."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "serial_number": self.serial_number,
+            "software_version": self.software_version,
+            "hardware_version": self.hardware_version,
+            "features": [feature.to_dict() for feature in self.features],
+            "unknown_feature_count": self.unknown_feature_count,
+            "capabilities": sorted(capability.name for capability in self.capabilities)
+        }
+
 
 @dataclass(frozen=True)
 class Open3eDataSystemInformation:
@@ -76,7 +196,7 @@ class Open3eDataSystemInformation:
 
     @staticmethod
     def from_dict(data: dict[str, Any]):
-        devices_dict: list[dict[str, Any]] = data.pop("devices")
+        devices_dict: list[dict[str, Any]] = data["devices"]
         devices: list[Open3eDataDevice] = []
 
         for device_dict in devices_dict:
@@ -85,3 +205,11 @@ class Open3eDataSystemInformation:
                 devices.append(device)
 
         return Open3eDataSystemInformation(devices)
+
+    @staticmethod
+    def from_json(payload: str | bytes):
+        """Decode and parse the system information. Runs in the executor as the payload can be large."""
+        return Open3eDataSystemInformation.from_dict(json_loads(payload))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"devices": [device.to_dict() for device in self.devices]}
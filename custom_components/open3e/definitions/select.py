@@ -1,12 +1,12 @@
 from dataclasses import dataclass
-from typing import Callable, Any, Awaitable
+from typing import Callable, Awaitable
 
 from homeassistant.components.select import SelectEntityDescription
 
 from .devices import Open3eDevices
 from .entity_description import Open3eEntityDescription
 from .features import Features
-from .open3e_data import Open3eDataDevice
+from .open3e_data import Open3eDataDevice, Open3eDataPayload
 from .subfeatures.buffer_mode import BufferMode
 from .subfeatures.bypass_operation_state import BypassOperationState, get_bypass_operation_state
 from .. import Open3eDataUpdateCoordinator
@@ -18,7 +18,7 @@ class Open3eSelectEntityDescription(
 ):
     """Default number entity description for open3e."""
     domain: str = "select"
-    get_option: Callable[[Any], str | None] = None
+    get_option: Callable[[Open3eDataPayload], str | None] = None
     set_option: Callable[[str, Open3eDataDevice, Open3eDataUpdateCoordinator], Awaitable[None]] = None
 
 
@@ -7,11 +7,12 @@ from homeassistant.const import UnitOfTemperature, UnitOfEnergy, PERCENTAGE, Uni
     EntityCategory, UnitOfPressure, UnitOfVolume, UnitOfVolumeFlowRate, UnitOfTime, \
     UnitOfElectricCurrent, UnitOfElectricPotential
 from homeassistant.util.dt import parse_time
-from homeassistant.util.json import json_loads
 
+from ..const import TEMPERATURE_DEADBAND
 from .devices import Open3eDevices
 from .entity_description import Open3eEntityDescription
 from .features import Features
+from .open3e_data import Open3eDataPayload
 from .subfeatures.connection_status import ConnectionStatus, get_connection_status
 from .subfeatures.domestic_hot_water_operation_state import (
     DomesticHotWaterOperationState,
@@ -51,53 +52,53 @@ from ..capability.capability import Capability
 class SensorDataRetriever:
     """Retriever functions for MQTT sensor data."""
 
-    ACTUAL = lambda data: float(json_loads(data)["Actual"])
-    MINIMUM = lambda data: float(json_loads(data)["Minimum"])
-    MAXIMUM = lambda data: float(json_loads(data)["Maximum"])
-    AVERAGE = lambda data: float(json_loads(data)["Average"])
-    ACTIVE_POWER = lambda data: float(json_loads(data)["ActivePower"])
-    TODAY = lambda data: float(json_loads(data)["Today"])
-    CURRENT_MONTH = lambda data: float(json_loads(data)["CurrentMonth"])
-    CURRENT_YEAR = lambda data: float(json_loads(data)["CurrentYear"])
-    PAST_YEAR = lambda data: float(json_loads(data)["PastYear"])
-    BATTERY_CHARGE_TODAY = lambda data: float(json_loads(data)["BatteryChargeToday"])
-    BATTERY_CHARGE_WEEK = lambda data: float(json_loads(data)["BatteryChargeWeek"])
-    BATTERY_CHARGE_MONTH = lambda data: float(json_loads(data)["BatteryChargeMonth"])
-    BATTERY_CHARGE_YEAR = lambda data: float(json_loads(data)["BatteryChargeYear"])
-    BATTERY_CHARGE_TOTAL = lambda data: float(json_loads(data)["BatteryChargeTotal"])
-    BATTERY_DISCHARGE_TODAY = lambda data: float(json_loads(data)["BatteryDischargeToday"])
-    BATTERY_DISCHARGE_WEEK = lambda data: float(json_loads(data)["BatteryDischargeWeek"])
-    BATTERY_DISCHARGE_MONTH = lambda data: float(json_loads(data)["BatteryDischargeMonth"])
-    BATTERY_DISCHARGE_YEAR = lambda data: float(json_loads(data)["BatteryDischargeYear"])
-    BATTERY_DISCHARGE_TOTAL = lambda data: float(json_loads(data)["BatteryDischargeTotal"])
-    PV_ENERGY_PRODUCTION_TODAY = lambda data: float(json_loads(data)["PhotovoltaicProductionToday"])
-    PV_ENERGY_PRODUCTION_WEEK = lambda data: float(json_loads(data)["PhotovoltaicProductionWeek"])
-    PV_ENERGY_PRODUCTION_MONTH = lambda data: float(json_loads(data)["PhotovoltaicProductionMonth"])
-    PV_ENERGY_PRODUCTION_YEAR = lambda data: float(json_loads(data)["PhotovoltaicProductionYear"])
-    PV_ENERGY_PRODUCTION_TOTAL = lambda data: float(json_loads(data)["PhotovoltaicProductionTotal"])
-    GRID_FEED_IN_ENERGY = lambda data: float(json_loads(data)["GridFeedInEnergy"])
-    GRID_SUPPLIED_ENERGY = lambda data: float(json_loads(data)["GridSuppliedEnergy"])
-    TEMPERATURE = lambda data: float(json_loads(data)["Temperature"])
-    TIME = lambda data: parse_time(str(data[1:][:-1]))
-    STANDARD = lambda data: float(json_loads(data)["Standard"])
-    PV_POWER_CUMULATED = lambda data: float(json_loads(data)["ActivePower cumulated"])
-    PV_POWER_STRING_1 = lambda data: float(json_loads(data)["ActivePower String A"])
-    PV_POWER_STRING_2 = lambda data: float(json_loads(data)["ActivePower String B"])
-    PV_POWER_STRING_3 = lambda data: float(json_loads(data)["ActivePower String C"])
-    PV_VOLTAGE_STRING_1 = lambda data: float(json_loads(data)["String1"])
-    PV_VOLTAGE_STRING_2 = lambda data: float(json_loads(data)["String2"])
-    PV_VOLTAGE_STRING_3 = lambda data: float(json_loads(data)["String3"])
-    STATE_OF_ENERGY = lambda data: float(json_loads(data)["StateOfEnergy"])
-    CURRENT = lambda data: float(json_loads(data)["Current"])
-    VOLTAGE = lambda data: float(json_loads(data)["Voltage"])
-    STARTS = lambda data: int(json_loads(data)["starts"])
-    HOURS = lambda data: int(json_loads(data)["hours"])
-    TARGET_FLOW = lambda data: float(json_loads(data)["TargetFlow"])
-    TEXT = lambda data: str(json_loads(data)["Text"])
-    UNKNOWN = lambda data: float(json_loads(data)["Unknown"])
-    RAWSTR = lambda data: str(data[1:][:-1])
-    HEX_INT = lambda data: int(str(data), 16) if data is not None else None
-    RAW = lambda data: float(data)
+    ACTUAL = lambda data: float(data.json["Actual"])
+    MINIMUM = lambda data: float(data.json["Minimum"])
+    MAXIMUM = lambda data: float(data.json["Maximum"])
+    AVERAGE = lambda data: float(data.json["Average"])
+    ACTIVE_POWER = lambda data: float(data.json["ActivePower"])
+    TODAY = lambda data: float(data.json["Today"])
+    CURRENT_MONTH = lambda data: float(data.json["CurrentMonth"])
+    CURRENT_YEAR = lambda data: float(data.json["CurrentYear"])
+    PAST_YEAR = lambda data: float(data.json["PastYear"])
+    BATTERY_CHARGE_TODAY = lambda data: float(data.json["BatteryChargeToday"])
+    BATTERY_CHARGE_WEEK = lambda data: float(data.json["BatteryChargeWeek"])
+    BATTERY_CHARGE_MONTH = lambda data: float(data.json["BatteryChargeMonth"])
+    BATTERY_CHARGE_YEAR = lambda data: float(data.json["BatteryChargeYear"])
+    BATTERY_CHARGE_TOTAL = lambda data: float(data.json["BatteryChargeTotal"])
+    BATTERY_DISCHARGE_TODAY = lambda data: float(data.json["BatteryDischargeToday"])
+    BATTERY_DISCHARGE_WEEK = lambda data: float(data.json["BatteryDischargeWeek"])
+    BATTERY_DISCHARGE_MONTH = lambda data: float(data.json["BatteryDischargeMonth"])
+    BATTERY_DISCHARGE_YEAR = lambda data: float(data.json["BatteryDischargeYear"])
+    BATTERY_DISCHARGE_TOTAL = lambda data: float(data.json["BatteryDischargeTotal"])
+    PV_ENERGY_PRODUCTION_TODAY = lambda data: float(data.json["PhotovoltaicProductionToday"])
+    PV_ENERGY_PRODUCTION_WEEK = lambda data: float(data.json["PhotovoltaicProductionWeek"])
+    PV_ENERGY_PRODUCTION_MONTH = lambda data: float(data.json["PhotovoltaicProductionMonth"])
+    PV_ENERGY_PRODUCTION_YEAR = lambda data: float(data.json["PhotovoltaicProductionYear"])
+    PV_ENERGY_PRODUCTION_TOTAL = lambda data: float(data.json["PhotovoltaicProductionTotal"])
+    GRID_FEED_IN_ENERGY = lambda data: float(data.json["GridFeedInEnergy"])
+    GRID_SUPPLIED_ENERGY = lambda data: float(data.json["GridSuppliedEnergy"])
+    TEMPERATURE = lambda data: float(data.json["Temperature"])
+    TIME = lambda data: parse_time(str(data.raw[1:][:-1]))
+    STANDARD = lambda data: float(data.json["Standard"])
+    PV_POWER_CUMULATED = lambda data: float(data.json["ActivePower cumulated"])
+    PV_POWER_STRING_1 = lambda data: float(data.json["ActivePower String A"])
+    PV_POWER_STRING_2 = lambda data: float(data.json["ActivePower String B"])
+    PV_POWER_STRING_3 = lambda data: float(data.json["ActivePower String C"])
+    PV_VOLTAGE_STRING_1 = lambda data: float(data.json["String1"])
+    PV_VOLTAGE_STRING_2 = lambda data: float(data.json["String2"])
+    PV_VOLTAGE_STRING_3 = lambda data: float(data.json["String3"])
+    STATE_OF_ENERGY = lambda data: float(data.json["StateOfEnergy"])
+    CURRENT = lambda data: float(data.json["Current"])
+    VOLTAGE = lambda data: float(data.json["Voltage"])
+    STARTS = lambda data: int(data.json["starts"])
+    HOURS = lambda data: int(data.json["hours"])
+    TARGET_FLOW = lambda data: float(data.json["TargetFlow"])
+    TEXT = lambda data: str(data.json["Text"])
+    UNKNOWN = lambda data: float(data.json["Unknown"])
+    RAWSTR = lambda data: str(data.raw[1:][:-1])
+    HEX_INT = lambda data: int(str(data.raw), 16) if data.raw is not None else None
+    RAW = lambda data: float(data.raw)
     """The data state represents a raw value without any encapsulation."""
 
     @staticmethod
@@ -137,7 +138,7 @@ class Open3eSensorEntityDescription(
 ):
     """Default sensor entity description for open3e."""
     domain: str = "sensor"
-    data_retriever: Callable[[Any], Any] | None = None
+    data_retriever: Callable[[Open3eDataPayload], Any] | None = None
 
 
 @dataclass(frozen=True)
@@ -156,7 +157,7 @@ class Open3eDerivedSensorEntityDescription(
                        derived sensor value.
     """
     domain: str = "sensor"
-    data_retrievers: List[Callable[[Any], Any]] | None = None
+    data_retrievers: List[Callable[[Open3eDataPayload], Any]] | None = None
     """
         List of functions to retrieve feature values. Each function takes
         the data object and returns a value to be used in the derived computation.
@@ -182,7 +183,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:account-wrench",
         key="service_manager_required",
         translation_key="service_manager_required",
-        data_retriever=lambda data: bool(int(data))
+        data_retriever=lambda data: bool(int(data.raw))
     ),
     Open3eSensorEntityDescription(
         poll_data_features=[Features.Misc.MalfunctionIdentification],
@@ -190,7 +191,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:file-document-alert",
         key="malfunction_id",
         translation_key="malfunction_id",
-        data_retriever=lambda data: int(data)
+        data_retriever=lambda data: int(data.raw)
     ),
     Open3eSensorEntityDescription(
         poll_data_features=[Features.Misc.ErrorDtcList],
@@ -199,7 +200,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="error_dtc_list",
         translation_key="error_dtc_list",
         data_retriever=lambda data: ", ".join(
-            {e["Error"]["Text"] for e in json_loads(data).get("ListEntries", [])}) or "-"
+            {e["Error"]["Text"] for e in data.json.get("ListEntries", [])}) or "-"
     ),
     Open3eSensorEntityDescription(
         poll_data_features=[Features.Misc.BackendConnectionStatus],
@@ -208,7 +209,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:lan-connect",
         key="connection_status",
         translation_key="connection_status",
-        data_retriever=lambda data: get_connection_status(int(data)),
+        data_retriever=lambda data: get_connection_status(int(data.raw)),
         options=[mode for mode in ConnectionStatus]
     ),
     Open3eSensorEntityDescription(
@@ -227,7 +228,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         entity_registry_enabled_default=False,
         key="gateway_remote_local_network_status",
         translation_key="gateway_remote_local_network_status",
-        data_retriever=lambda data: get_connection_status(int(data)),
+        data_retriever=lambda data: get_connection_status(int(data.raw)),
         options=[mode for mode in ConnectionStatus]
     ),
     Open3eSensorEntityDescription(
@@ -236,7 +237,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="gateway_remote_ip",
         translation_key="gateway_remote_ip",
         icon="mdi:ip-network",
-        data_retriever=lambda data: SensorDataRetriever.cleaned_ip(json_loads(data)["WLAN_IP-Address"])
+        data_retriever=lambda data: SensorDataRetriever.cleaned_ip(data.json["WLAN_IP-Address"])
     ),
     Open3eSensorEntityDescription(
         poll_data_features=[Features.Misc.GatewayRemoteSignalStrength],
@@ -527,7 +528,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         translation_key="vitodens_device_date",
         icon="mdi:calendar",
         entity_registry_enabled_default=False,
-        data_retriever=lambda data: SensorDataRetriever.parse_date_vitodensstr(data[1:][:-1]),
+        data_retriever=lambda data: SensorDataRetriever.parse_date_vitodensstr(data.raw[1:][:-1]),
         required_device=Open3eDevices.Vitodens
     ),
     Open3eSensorEntityDescription(
@@ -548,7 +549,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         translation_key="heat_engine_statistical_operating_hours",
         native_unit_of_measurement=UnitOfTime.HOURS,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        data_retriever=lambda data: int(json_loads(data)["OperatingHours"]),
+        data_retriever=lambda data: int(data.json["OperatingHours"]),
         required_device=Open3eDevices.Vitodens
     ),
     Open3eSensorEntityDescription(
@@ -558,7 +559,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         translation_key="heat_engine_statistical_burner_hours",
         native_unit_of_measurement=UnitOfTime.HOURS,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        data_retriever=lambda data: int(json_loads(data)["BurnerHours"]),
+        data_retriever=lambda data: int(data.json["BurnerHours"]),
         required_device=Open3eDevices.Vitodens
     ),
     Open3eSensorEntityDescription(
@@ -578,7 +579,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         translation_key="legionella_protection_weekday",
         entity_registry_enabled_default=False,
         icon="mdi:water-plus",
-        data_retriever=lambda data: LegionellaProtectionWeekday.get_lp_weekday(int(data)),
+        data_retriever=lambda data: LegionellaProtectionWeekday.get_lp_weekday(int(data.raw)),
         options=[wday for wday in LegionellaProtectionWeekday],
         required_device=Open3eDevices.Vitodens
     ),
@@ -589,7 +590,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         translation_key="service_date_next",
         entity_registry_enabled_default=False,
         icon="mdi:calendar",
-        data_retriever=lambda data: SensorDataRetriever.parse_date_vitodensstr(json_loads(data)["Date"]),
+        data_retriever=lambda data: SensorDataRetriever.parse_date_vitodensstr(data.json["Date"]),
         required_device=Open3eDevices.Vitodens
     ),
 
@@ -718,6 +719,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="flow_temperature",
         translation_key="flow_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -728,6 +730,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="return_temperature",
         translation_key="return_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -738,6 +741,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="domestic_hot_water_temperature",
         translation_key="domestic_hot_water_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -939,6 +943,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="outside_temperature",
         translation_key="outside_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -949,6 +954,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="primary_heat_exchanger_temperature",
         translation_key="primary_heat_exchanger_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -959,6 +965,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="secondary_heat_exchanger_temperature",
         translation_key="secondary_heat_exchanger_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -979,6 +986,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="flow_circuit1_temperature",
         translation_key="flow_circuit1_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -990,6 +998,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="flow_circuit2_temperature",
         translation_key="flow_circuit2_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1001,6 +1010,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="flow_circuit3_temperature",
         translation_key="flow_circuit3_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1012,6 +1022,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="flow_circuit4_temperature",
         translation_key="flow_circuit4_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1023,6 +1034,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="compressor_inlet_temperature",
         translation_key="compressor_inlet_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1043,6 +1055,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="compressor_outlet_temperature",
         translation_key="compressor_outlet_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1063,6 +1076,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="room1_temperature",
         translation_key="room1_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1074,6 +1088,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="room2_temperature",
         translation_key="room2_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1085,6 +1100,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="room3_temperature",
         translation_key="room3_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1096,6 +1112,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="room4_temperature",
         translation_key="room4_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1147,6 +1164,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="primary_inlet_temperature",
         translation_key="primary_inlet_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1157,6 +1175,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="secondary_outlet_temperature",
         translation_key="secondary_outlet_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -1389,7 +1408,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:home-battery-outline",
         key="energy_management_mode",
         translation_key="energy_management_mode",
-        data_retriever=lambda data: ENERGY_MANAGEMENT_MODES_MAP.get(int(data)),
+        data_retriever=lambda data: ENERGY_MANAGEMENT_MODES_MAP.get(int(data.raw)),
         options=[mode for mode in EnergyManagementMode],
         required_device=Open3eDevices.Vitocal
     ),
@@ -1555,7 +1574,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="smart_grid_ready_consolidator",
         translation_key="smart_grid_ready_consolidator",
         data_retriever=lambda data: SMART_GRID_READY_STATUS_MAP.get(
-            int(json_loads(data)["OperatingStatus"])
+            int(data.json["OperatingStatus"])
         ),
         options=[mode for mode in SmartGridReadyStatus],
         required_device=Open3eDevices.Vitocal
@@ -1570,7 +1589,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="domestic_hot_water_pump_min_speed",
         translation_key="domestic_hot_water_pump_min_speed",
         icon="mdi:pump",
-        data_retriever=lambda data: float(json_loads(data)["MinSpeed"]),
+        data_retriever=lambda data: float(data.json["MinSpeed"]),
         required_device=Open3eDevices.Vitocal
     ),
     # DID 1101: DomesticHotWaterPumpMaximumLimit
@@ -1582,7 +1601,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="domestic_hot_water_pump_max_speed",
         translation_key="domestic_hot_water_pump_max_speed",
         icon="mdi:pump",
-        data_retriever=lambda data: float(json_loads(data)["MaxSpeed"]),
+        data_retriever=lambda data: float(data.json["MaxSpeed"]),
         required_device=Open3eDevices.Vitocal
     ),
 
@@ -1711,7 +1730,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="compressor_min_speed_heating",
         translation_key="compressor_min_speed_heating",
         icon="mdi:fan-minus",
-        data_retriever=lambda data: float(json_loads(data)["Min"]),
+        data_retriever=lambda data: float(data.json["Min"]),
         required_device=Open3eDevices.Vitocal
     ),
     Open3eSensorEntityDescription(
@@ -1722,7 +1741,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="compressor_max_speed_heating",
         translation_key="compressor_max_speed_heating",
         icon="mdi:fan-plus",
-        data_retriever=lambda data: float(json_loads(data)["Max"]),
+        data_retriever=lambda data: float(data.json["Max"]),
         required_device=Open3eDevices.Vitocal
     ),
 
@@ -1758,7 +1777,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="circuit1_pump_status",
         translation_key="circuit1_pump_status",
         icon="mdi:pump",
-        data_retriever=lambda data: None if (val := float(json_loads(data)["Actual"])) == 255 else val,
+        data_retriever=lambda data: None if (val := float(data.json["Actual"])) == 255 else val,
         required_capabilities=[Capability.Circuit1],
         required_device=Open3eDevices.Vitocal
     ),
@@ -1796,7 +1815,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:snowflake-melt",
         key="circuit1_frost_protection_config",
         translation_key="circuit1_frost_protection_config",
-        data_retriever=lambda data: float(json_loads(data)["Temperature"]),
+        data_retriever=lambda data: float(data.json["Temperature"]),
         required_capabilities=[Capability.Circuit1],
         required_device=Open3eDevices.Vitocal
     ),
@@ -1808,7 +1827,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:snowflake-melt",
         key="circuit2_frost_protection_config",
         translation_key="circuit2_frost_protection_config",
-        data_retriever=lambda data: float(json_loads(data)["Temperature"]),
+        data_retriever=lambda data: float(data.json["Temperature"]),
         required_capabilities=[Capability.Circuit2],
         required_device=Open3eDevices.Vitocal
     ),
@@ -2232,6 +2251,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="outdoor_air_temperature",
         translation_key="outdoor_air_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -2242,6 +2262,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="supply_air_temperature",
         translation_key="supply_air_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -2252,6 +2273,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="extract_air_temperature",
         translation_key="extract_air_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -2262,6 +2284,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=TEMPERATURE_DEADBAND,
         key="exhaust_air_temperature",
         translation_key="exhaust_air_temperature",
         data_retriever=SensorDataRetriever.ACTUAL,
@@ -2314,7 +2337,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:fan",
         key="supply_air_fan_speed",
         translation_key="supply_air_fan_speed",
-        data_retriever=lambda data: float(json_loads(data)["Actual"]) * 10,
+        data_retriever=lambda data: float(data.json["Actual"]) * 10,
         required_device=Open3eDevices.Vitoair
     ),
     Open3eSensorEntityDescription(
@@ -2324,7 +2347,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         icon="mdi:fan",
         key="exhaust_air_fan_speed",
         translation_key="exhaust_air_fan_speed",
-        data_retriever=lambda data: float(json_loads(data)["Actual"]) * 10,
+        data_retriever=lambda data: float(data.json["Actual"]) * 10,
         required_device=Open3eDevices.Vitoair
     ),
     Open3eSensorEntityDescription(
@@ -2356,7 +2379,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="ventilation_level",
         translation_key="ventilation_level",
         data_retriever=lambda data: float(
-            (payload := json_loads(data)).get("Actual", payload.get("Acutual", 0))
+            (payload := data.json).get("Actual", payload.get("Acutual", 0))
         ),
         # Acutual intended, typo on Open3e for VentilationLevel (533)
         required_device=Open3eDevices.Vitoair
@@ -2387,7 +2410,7 @@ SENSORS: tuple[Open3eSensorEntityDescription, ...] = (
         key="ventilation_bypass_flap_available_count",
         translation_key="ventilation_bypass_flap_available_count",
         icon="mdi:counter",
-        data_retriever=lambda value: int(value),
+        data_retriever=lambda data: int(data.raw),
         required_device=Open3eDevices.Vitoair
     ),
     Open3eSensorEntityDescription(
@@ -1,7 +1,6 @@
 from enum import StrEnum
-from typing import Any
 
-from homeassistant.util.json import json_loads
+from ..open3e_data import Open3eDataPayload
 
 
 class BufferMode(StrEnum):
@@ -9,8 +8,8 @@ class BufferMode(StrEnum):
     Cooling = "cooling"
 
     @staticmethod
-    def from_operation_mode(mode: Any):
-        match json_loads(mode):
+    def from_operation_mode(mode: Open3eDataPayload):
+        match mode.json:
             case 0:
                 return BufferMode.Heating
             case 1:
@@ -1,7 +1,6 @@
 from enum import StrEnum
-from typing import Any
 
-from homeassistant.util.json import json_loads
+from ..open3e_data import Open3eDataPayload
 
 
 class BypassOperationState(StrEnum):
@@ -30,11 +29,10 @@ class BypassOperationState(StrEnum):
                 return 2
 
 
-def get_bypass_operation_state(data: Any) -> BypassOperationState | None:
+def get_bypass_operation_state(data: Open3eDataPayload) -> BypassOperationState | None:
     try:
-        if isinstance(data, str) and data.strip().startswith("{"):
-            payload = json_loads(data)
-            value = payload.get("BypassStatus")
+        if data.raw.strip().startswith("{"):
+            value = data.json.get("BypassStatus")
             if value is None:
                 return None
         else:
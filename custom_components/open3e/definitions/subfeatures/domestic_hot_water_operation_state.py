@@ -1,7 +1,6 @@
 from enum import StrEnum
-from typing import Any
 
-from homeassistant.util.json import json_loads
+from ..open3e_data import Open3eDataPayload
 
 
 class DomesticHotWaterOperationState(StrEnum):
@@ -29,34 +28,30 @@ DOMESTIC_HOT_WATER_OPERATION_STATE_MAP = {
 }
 
 
-def get_domestic_hot_water_operation_state(data: Any) -> DomesticHotWaterOperationState | None:
+def get_domestic_hot_water_operation_state(data: Open3eDataPayload) -> DomesticHotWaterOperationState | None:
     """Parse legacy integer payloads and new JSON payloads for feature 531."""
     try:
-        if isinstance(data, str):
-            stripped = data.strip()
-
-            # New format: {"Mode": 0, "State": {"ID": 1, "Text": "Hot water"}}
-            if stripped.startswith("{"):
-                payload = json_loads(stripped)
-                state_data = payload.get("State")
-                if isinstance(state_data, dict):
-                    state_id = int(state_data.get("ID", -1))
-                elif isinstance(state_data, (str, int, float)):
-                    state_id = int(state_data)
-                else:
-                    state_id = -1
+        stripped = data.raw.strip()
+
+        # New format: {"Mode": 0, "State": {"ID": 1, "Text": "Hot water"}}
+        if stripped.startswith("{"):
+            state_data = data.json.get("State")
+            if isinstance(state_data, dict):
+                state_id = int(state_data.get("ID", -1))
+            elif isinstance(state_data, (str, int, float)):
+                state_id = int(state_data)
             else:
-                # Legacy format: 1
-                state_id = int(stripped)
+                state_id = -1
         else:
-            state_id = int(data)
+            # Legacy format: 1
+            state_id = int(stripped)
     except (TypeError, ValueError, KeyError, AttributeError):
         return None
 
     return DOMESTIC_HOT_WATER_OPERATION_STATE_MAP.get(state_id)
 
 
-def is_domestic_hot_water_operation_state_active(data: Any) -> bool:
+def is_domestic_hot_water_operation_state_active(data: Open3eDataPayload) -> bool:
     """Determine if DHW operation state is active for binary sensor (legacy and new)."""
     state = get_domestic_hot_water_operation_state(data)
     if state is None:
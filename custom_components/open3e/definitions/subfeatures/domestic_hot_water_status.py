@@ -1,7 +1,6 @@
 from enum import StrEnum
-from typing import Any
 
-from homeassistant.util.json import json_loads
+from ..open3e_data import Open3eDataPayload
 
 
 class DomesticHotWaterStatus(StrEnum):
@@ -17,11 +16,11 @@ DOMESTIC_HOT_WATER_STATUS_MAP = {
 }
 
 
-def get_domestic_hot_water_status(data: Any) -> DomesticHotWaterStatus | None:
+def get_domestic_hot_water_status(data: Open3eDataPayload) -> DomesticHotWaterStatus | None:
     """Parse legacy integer payloads and new JSON payloads for feature 2320."""
     try:
-        if isinstance(data, str) and data.strip().startswith("{"):
-            payload = json_loads(data)
+        if data.raw.strip().startswith("{"):
+            payload = data.json
             # DomesticHotWaterStatus often comes as an enum complex type
             raw_id = payload.get("ID") if payload.get("ID") is not None else payload.get("State", {}).get("ID")
             if raw_id is None:
@@ -29,7 +28,7 @@ def get_domestic_hot_water_status(data: Any) -> DomesticHotWaterStatus | None:
             value = int(raw_id)
         else:
             # Legacy format (simple integer or byte)
-            value = int(data)
+            value = int(data.raw)
         return DOMESTIC_HOT_WATER_STATUS_MAP.get(value)
     except (TypeError, ValueError, KeyError):
         return None
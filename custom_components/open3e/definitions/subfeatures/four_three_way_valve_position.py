@@ -1,7 +1,6 @@
 from enum import StrEnum
-from typing import Any
 
-from homeassistant.util.json import json_loads
+from ..open3e_data import Open3eDataPayload
 
 
 class FourThreeWayValvePosition(StrEnum):
@@ -18,21 +17,17 @@ FOUR_THREE_WAY_VALVE_POSITION_MAP = {
 }
 
 
-def get_four_three_way_valve_position(data: Any) -> FourThreeWayValvePosition | None:
+def get_four_three_way_valve_position(data: Open3eDataPayload) -> FourThreeWayValvePosition | None:
     """Parse legacy integer payloads and new JSON payloads for feature 2735."""
     try:
-        if isinstance(data, str):
-            stripped = data.strip()
-
-            # New format: {"ID": 1, "Text": "Internal Buffer"}
-            if stripped.startswith("{"):
-                payload = json_loads(stripped)
-                valve_id = int(payload.get("ID", -1))
-            else:
-                # Legacy format: 1
-                valve_id = int(stripped)
+        stripped = data.raw.strip()
+
+        # New format: {"ID": 1, "Text": "Internal Buffer"}
+        if stripped.startswith("{"):
+            valve_id = int(data.json.get("ID", -1))
         else:
-            valve_id = int(data)
+            # Legacy format: 1
+            valve_id = int(stripped)
     except (TypeError, ValueError, KeyError, AttributeError):
         return None
 
@@ -1,5 +1,6 @@
 from enum import StrEnum
-from typing import Any
+
+from ..open3e_data import Open3eDataPayload
 
 
 class NoiseReductionMode(StrEnum):
@@ -15,10 +16,10 @@ NOISE_REDUCTION_MODE_MAP: dict[int, NoiseReductionMode] = {
 }
 
 
-def get_noise_reduction_mode(data: Any) -> NoiseReductionMode | None:
+def get_noise_reduction_mode(data: Open3eDataPayload) -> NoiseReductionMode | None:
     """Parse integer payload for feature 2634."""
     try:
-        value = int(data)
+        value = int(data.raw)
         return NOISE_REDUCTION_MODE_MAP.get(value)
     except (TypeError, ValueError):
         return None
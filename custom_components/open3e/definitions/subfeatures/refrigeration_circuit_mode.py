@@ -1,7 +1,6 @@
 from enum import StrEnum
-from typing import Any
 
-from homeassistant.util.json import json_loads
+from ..open3e_data import Open3eDataPayload
 
 
 class RefrigerationCircuitOperationMode(StrEnum):
@@ -25,12 +24,11 @@ REFRIGERATION_CIRCUIT_OPERATION_MODES_MAP: dict[int, RefrigerationCircuitOperati
 }
 
 
-def get_refrigeration_circuit_mode(data: Any) -> RefrigerationCircuitOperationMode | None:
+def get_refrigeration_circuit_mode(data: Open3eDataPayload) -> RefrigerationCircuitOperationMode | None:
     """Parse legacy and current JSON payloads for feature 2806."""
     try:
-        if isinstance(data, str) and data.strip().startswith("{"):
-            payload = json_loads(data)
-            state = payload.get("State")
+        if data.raw.strip().startswith("{"):
+            state = data.json.get("State")
             if isinstance(state, dict):
                 # Current format: {"State": {"ID": 1, ...}}
                 raw_id = state.get("ID")
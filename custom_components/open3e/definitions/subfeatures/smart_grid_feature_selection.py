@@ -1,5 +1,6 @@
 from enum import StrEnum
-from typing import Any
+
+from ..open3e_data import Open3eDataPayload
 
 
 class SmartGridFeatureSelection(StrEnum):
@@ -17,10 +18,10 @@ SMART_GRID_FEATURE_SELECTION_MAP: dict[int, SmartGridFeatureSelection] = {
 }
 
 
-def get_smart_grid_feature_selection(data: Any) -> SmartGridFeatureSelection | None:
+def get_smart_grid_feature_selection(data: Open3eDataPayload) -> SmartGridFeatureSelection | None:
     """Parse integer payload for feature 2560."""
     try:
-        value = int(data)
+        value = int(data.raw)
         return SMART_GRID_FEATURE_SELECTION_MAP.get(value)
     except (TypeError, ValueError):
         return None
@@ -1,5 +1,6 @@
 from enum import StrEnum
-from typing import Any
+
+from ..open3e_data import Open3eDataPayload
 
 
 class VentilationBypassOperationLevel(StrEnum):
@@ -13,10 +14,10 @@ VENTILATION_BYPASS_OPERATION_LEVEL_MAP: dict[int, VentilationBypassOperationLeve
 }
 
 
-def get_ventilation_bypass_operation_level(data: Any) -> VentilationBypassOperationLevel | None:
+def get_ventilation_bypass_operation_level(data: Open3eDataPayload) -> VentilationBypassOperationLevel | None:
     """Parse integer payload for feature 2403."""
     try:
-        value = int(float(data))
+        value = int(float(data.raw))
         return VENTILATION_BYPASS_OPERATION_LEVEL_MAP.get(value)
     except (TypeError, ValueError):
         return None
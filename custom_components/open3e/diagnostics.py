@@ -0,0 +1,33 @@
+"""Diagnostics support for open3e."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .ha_data import Open3eDataConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+        hass: HomeAssistant,
+        entry: Open3eDataConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+
+    return {
+        "options": dict(entry.options),
+        "devices": [
+            {
+                "id": device.id,
+                "name": device.name,
+                "software_version": device.software_version,
+                "hardware_version": device.hardware_version,
+                "capabilities": sorted(capability.name for capability in device.capabilities),
+                "feature_count": len(device.features),
+                "unknown_feature_count": device.unknown_feature_count
+            }
+            for device in coordinator.system_information.devices
+        ]
+    }
@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Callable, Any
+from asyncio import TimerHandle
+from typing import Any
 
-from homeassistant.components import mqtt
-from homeassistant.components.mqtt import ReceiveMessage
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
-from .const import DOMAIN
+from .const import DOMAIN, ENTITY_STATE_WRITE_DELAY
 from .coordinator import Open3eDataUpdateCoordinator
 from .definitions.entity_description import Open3eEntityDescription
-from .definitions.open3e_data import Open3eDataDevice, Open3eDataDeviceFeature
+from .definitions.open3e_data import Open3eDataDevice, Open3eDataDeviceFeature, Open3eDataPayload
 
 
 class Open3eEntity(CoordinatorEntity, Entity):
@@ -26,9 +25,11 @@ class Open3eEntity(CoordinatorEntity, Entity):
 
     device: Open3eDataDevice
     __mqtt_topics: list[Open3eDataDeviceFeature]
-    __mqtt_subscriptions: list[Callable]
 
-    data: dict[int, Any]
+    data: dict[int, Open3eDataPayload]
+    __written_values: tuple[Any, ...] | None
+    __pending_values: tuple[Any, ...]
+    __pending_write: TimerHandle | None
 
     def __init__(
             self,
@@ -56,47 +57,90 @@ class Open3eEntity(CoordinatorEntity, Entity):
         )
         self._attr_has_entity_name = True
         self.entity_description = description
-        self.__mqtt_subscriptions = []
         self.data = {}
+        self.__written_values = None
+        self.__pending_values = ()
+        self.__pending_write = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
         await self.coordinator.on_entity_added(self.entity_description.poll_data_features, self.device)
 
-        for mqtt_topic in self.__mqtt_topics:
-            await self._async_register_callback(mqtt_topic=mqtt_topic)
-
-    async def _async_register_callback(self, mqtt_topic: Open3eDataDeviceFeature):
-        async def msg_callback(message: any):
-            await self._prepare_data(mqtt_topic.id, message)
-
-        self.__mqtt_subscriptions.append(
-            await mqtt.async_subscribe(
-                hass=self.hass,
-                topic=mqtt_topic.topic,
-                msg_callback=msg_callback
+        self.async_on_remove(
+            self.coordinator.async_add_feature_listener(
+                device=self.device,
+                feature_ids=[mqtt_topic.id for mqtt_topic in self.__mqtt_topics],
+                listener=self._prepare_data
             )
         )
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        self.coordinator.on_entity_removed(self.entity_description.poll_data_features, self.device)
+        if self.__pending_write is not None:
+            self.__pending_write.cancel()
+            self.__pending_write = None
 
-        for sub in self.__mqtt_subscriptions:
-            sub()
-        self.__mqtt_subscriptions.clear()
+        self.coordinator.on_entity_removed(self.entity_description.poll_data_features, self.device)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """We are not updating via coordinator as we are using MQTT custom update"""
 
-    async def _prepare_data(self, feature_id: int, message: ReceiveMessage):
+    @callback
+    def async_write_ha_state_on_change(self, *values: Any):
+        """
+        Write the state only if one of the values representing it changed since the last write.
+        Numeric changes smaller than the deadband of the description are ignored.
+        Entities with multiple features collect updates for a moment, so features received together
+        result in a single state write.
+        """
+        self.__pending_values = values
+
+        if len(self.__mqtt_topics) <= 1:
+            self.__async_write_pending_values()
+        elif self.__pending_write is None:
+            self.__pending_write = self.hass.loop.call_later(
+                ENTITY_STATE_WRITE_DELAY,
+                self.__async_write_pending_values
+            )
+
+    @callback
+    def __async_write_pending_values(self):
+        self.__pending_write = None
+        values = self.__pending_values
+
+        if self.__written_values is not None and not self.__has_changed(self.__written_values, values):
+            return
+
+        self.__written_values = values
+        self.async_write_ha_state()
+
+    def __has_changed(self, old_values: tuple[Any, ...], new_values: tuple[Any, ...]) -> bool:
+        deadband = self.entity_description.deadband
+
+        for old_value, new_value in zip(old_values, new_values):
+            if (
+                    deadband is not None
+                    and isinstance(old_value, (int, float)) and not isinstance(old_value, bool)
+                    and isinstance(new_value, (int, float)) and not isinstance(new_value, bool)
+            ):
+                # Rounded, so a step of the sensor resolution is not lost to floating point errors, e.g. 20.3 - 20.2
+                if round(abs(new_value - old_value), 6) >= deadband:
+                    return True
+            elif old_value != new_value:
+                return True
+
+        return False
+
+    @callback
+    def _prepare_data(self, feature_id: int, payload: Open3eDataPayload):
         """Prepares data when received from MQTT endpoint"""
-        self.data[feature_id] = message.payload
-        await self.async_on_data(feature_id)
+        self.data[feature_id] = payload
+        self.async_on_data(feature_id)
 
-    async def async_on_data(self, feature_id: int):
+    @callback
+    def async_on_data(self, feature_id: int):
         """Run when new data has been received from any MQTT endpoint.
 
         To be extended by specific entities.
@@ -30,6 +30,19 @@ class Open3eServerUnavailableError(
         )
 
 
+class Open3eWriteCancelledError(
+    HomeAssistantError
+):
+    """Exception to indicate that a pending write was discarded because its entity was removed."""
+
+    def __init__(self) -> None:
+        """Initialize the error."""
+        super().__init__(
+            translation_domain=DOMAIN,
+            translation_key="write_cancelled"
+        )
+
+
 class Open3eError(
     HomeAssistantError
 ):
@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import cast
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.json import json_loads
 from homeassistant.util.percentage import ranged_value_to_percentage, percentage_to_ranged_value
 from homeassistant.util.scaling import int_states_in_range
 
 from .coordinator import Open3eDataUpdateCoordinator
 from .definitions.fan import FAN, Open3eFanEntityDescription
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .definitions.subfeatures.ventilation_mode import VentilationMode
 from .entity import Open3eEntity
@@ -22,6 +21,8 @@ from .util import map_devices_to_entities
 
 VENTILATION_SPEED_RANGE = (1, 4)
 
+FAN_REGISTRY = Open3eEntityDescriptionRegistry(FAN)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -30,7 +31,7 @@ async def async_setup_entry(
 ) -> None:
     device_fan_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        FAN
+        FAN_REGISTRY
     )
 
     # Add entities for each device
@@ -77,8 +78,8 @@ class Open3eFan(Open3eEntity, FanEntity):
         # Percentage can only be set in continuous mode
         if self.current_mode != VentilationMode.Continuous:
             await self.async_set_ventilation_mode(VentilationMode.Continuous)
-            # Wait for program to be set
-            await asyncio.sleep(1)
+            # Wait for the mode to be confirmed by Open3e
+            await self.coordinator.async_read_features(self.device, [self.entity_description.mode_feature.id])
 
         level = percentage_to_ranged_value(VENTILATION_SPEED_RANGE, percentage)
         await self.coordinator.async_set_ventilation_level(
@@ -110,14 +111,15 @@ class Open3eFan(Open3eEntity, FanEntity):
     def available(self):
         return self.current_speed_level is not None and self.current_speed_level < 255
 
-    async def async_on_data(self, feature_id: int):
+    @callback
+    def async_on_data(self, feature_id: int):
         """Handle updated data from MQTT."""
         match feature_id:
             case self.entity_description.speed_level_feature.id:
-                self.current_speed_level = int(json_loads(self.data[feature_id])["Acutual"])  # intended, typo on Open3e
+                self.current_speed_level = int(self.data[feature_id].json["Acutual"])  # intended, typo on Open3e
 
             case self.entity_description.mode_feature.id:
                 self.current_mode = VentilationMode.from_operation_mode(
-                    json_loads(self.data[feature_id])["Mode"])
+                    self.data[feature_id].json["Mode"])
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_on_change(self.current_speed_level, self.current_mode)
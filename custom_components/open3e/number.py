@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from typing import cast
 
 from homeassistant.components.number import NumberEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.json import json_loads
 
+from .const import NUMBER_WRITE_DEBOUNCE
 from .coordinator import Open3eDataUpdateCoordinator
 from .definitions.numbers import Open3eNumberEntityDescription, NUMBERS
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .entity import Open3eEntity
+from .errors import Open3eWriteCancelledError
 from .ha_data import Open3eDataConfigEntry
 from .util import map_devices_to_entities
 
+_LOGGER = logging.getLogger(__name__)
+
+NUMBER_REGISTRY = Open3eEntityDescriptionRegistry(NUMBERS)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -24,7 +32,7 @@ async def async_setup_entry(
 ) -> None:
     device_number_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        NUMBERS
+        NUMBER_REGISTRY
     )
 
     for device, numbers in device_number_map.items():
@@ -40,6 +48,10 @@ async def async_setup_entry(
 
 class Open3eNumber(Open3eEntity, NumberEntity):
     entity_description: Open3eNumberEntityDescription
+    __pending_value: float | None
+    __pending_write: asyncio.TimerHandle | None
+    __pending_result: asyncio.Future | None
+    """Resolved once the pending value is written, so every coalesced call gets the result of the write."""
 
     def __init__(
             self,
@@ -48,23 +60,76 @@ class Open3eNumber(Open3eEntity, NumberEntity):
             device: Open3eDataDevice
     ):
         super().__init__(coordinator, description, device)
+        self.__pending_value = None
+        self.__pending_write = None
+        self.__pending_result = None
 
     @property
     def available(self):
         """Return True if entity is available."""
         return self.native_value is not None
 
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.__cancel_pending_write)
+
     async def async_set_native_value(self, value: float) -> None:
-        """Set new value."""
+        """
+        Set new value. Values set in quick succession are coalesced and only the last one is written.
+        Each number writes exactly one (device, feature, sub feature), so the delay restarts on every call
+        and a value set while the previous one is still being written is written afterward.
+        """
         if self.entity_description.set_native_value is None:
             return
 
-        await self.entity_description.set_native_value(value, self.device, self.coordinator)
+        self.__pending_value = value
+        if self.__pending_write is not None:
+            self.__pending_write.cancel()
+        if self.__pending_result is None:
+            self.__pending_result = self.hass.loop.create_future()
+
+        result = self.__pending_result
+        self.__pending_write = self.hass.loop.call_later(NUMBER_WRITE_DEBOUNCE, self.__write_pending_value)
+        await result
+
+    @callback
+    def __write_pending_value(self):
+        value = self.__pending_value
+        result = self.__pending_result
+        self.__pending_value = None
+        self.__pending_result = None
+        self.__pending_write = None
+
+        self.hass.async_create_task(self.__async_write_value(value, result))
+
+    async def __async_write_value(self, value: float, result: asyncio.Future):
+        try:
+            await self.entity_description.set_native_value(value, self.device, self.coordinator)
+        except Exception as exception:
+            if not result.done():
+                result.set_exception(exception)
+        else:
+            if not result.done():
+                result.set_result(None)
+
+    @callback
+    def __cancel_pending_write(self):
+        if self.__pending_write is not None:
+            self.__pending_write.cancel()
+            self.__pending_write = None
+
+        if self.__pending_result is not None:
+            _LOGGER.debug("Discarding the pending write of %s as the entity was removed", self.entity_id)
+            self.__pending_result.set_exception(Open3eWriteCancelledError())
+            self.__pending_value = None
+            self.__pending_result = None
 
-    async def async_on_data(self, feature_id: int) -> None:
+    @callback
+    def async_on_data(self, feature_id: int) -> None:
         """Handle updated data from MQTT."""
         if self.entity_description.get_native_value is None:
             return
 
-        self._attr_native_value = self.entity_description.get_native_value(json_loads(self.data[feature_id]))
-        self.async_write_ha_state()
+        self._attr_native_value = self.entity_description.get_native_value(self.data[feature_id].json)
+        self.async_write_ha_state_on_change(self._attr_native_value)
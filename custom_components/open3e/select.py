@@ -5,16 +5,19 @@ from __future__ import annotations
 from typing import cast
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import Open3eDataUpdateCoordinator
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .definitions.select import Open3eSelectEntityDescription, SELECTS
 from .entity import Open3eEntity
 from .ha_data import Open3eDataConfigEntry
 from .util import map_devices_to_entities
 
+SELECT_REGISTRY = Open3eEntityDescriptionRegistry(SELECTS)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -23,7 +26,7 @@ async def async_setup_entry(
 ) -> None:
     device_select_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        SELECTS
+        SELECT_REGISTRY
     )
 
     for device, selects in device_select_map.items():
@@ -61,10 +64,11 @@ class Open3eSelect(Open3eEntity, SelectEntity):
 
         await self.entity_description.set_option(option, self.device, self.coordinator)
 
-    async def async_on_data(self, feature_id: int) -> None:
+    @callback
+    def async_on_data(self, feature_id: int) -> None:
         """Handle updated data from MQTT."""
         if self.entity_description.get_option is None:
             return
 
         self._attr_current_option = self.entity_description.get_option(self.data[feature_id])
-        self.async_write_ha_state()
+        self.async_write_ha_state_on_change(self._attr_current_option)
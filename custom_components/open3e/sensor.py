@@ -5,12 +5,13 @@ from __future__ import annotations
 from typing import Any, cast
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import VIESSMANN_UNAVAILABLE_VALUE
 
 from .coordinator import Open3eDataUpdateCoordinator
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .definitions.sensors import Open3eSensorEntityDescription, DERIVED_SENSORS, Open3eDerivedSensorEntityDescription
 from .definitions.sensors import SENSORS
@@ -18,6 +19,9 @@ from .entity import Open3eEntity
 from .ha_data import Open3eDataConfigEntry
 from .util import map_devices_to_entities
 
+SENSOR_REGISTRY = Open3eEntityDescriptionRegistry(SENSORS)
+DERIVED_SENSOR_REGISTRY = Open3eEntityDescriptionRegistry(DERIVED_SENSORS)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -26,7 +30,7 @@ async def async_setup_entry(
 ) -> None:
     device_sensor_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        SENSORS
+        SENSOR_REGISTRY
     )
 
     for device, sensors in device_sensor_map.items():
@@ -41,7 +45,7 @@ async def async_setup_entry(
 
     device_derived_sensor_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        DERIVED_SENSORS
+        DERIVED_SENSOR_REGISTRY
     )
 
     for device, sensors in device_derived_sensor_map.items():
@@ -78,10 +82,11 @@ class Open3eSensor(Open3eEntity, SensorEntity):
 
         return True
 
-    async def async_on_data(self, feature_id: int) -> None:
+    @callback
+    def async_on_data(self, feature_id: int) -> None:
         """Handle updated data from MQTT."""
         self._attr_native_value = self.__filter_data(self.data[feature_id])
-        self.async_write_ha_state()
+        self.async_write_ha_state_on_change(self._attr_native_value)
 
     def __filter_data(self, data: Any):
         return self.entity_description.data_retriever(data)
@@ -105,7 +110,8 @@ class Open3eDerivedSensor(Open3eEntity, SensorEntity):
         """Return True if entity is available."""
         return self._attr_native_value is not None
 
-    async def async_on_data(self, feature_id: int) -> None:
+    @callback
+    def async_on_data(self, feature_id: int) -> None:
         """Handle updated data from MQTT."""
         # store the raw data in the buffer
         self.__pending_data[feature_id] = self.data[feature_id]
@@ -129,6 +135,5 @@ class Open3eDerivedSensor(Open3eEntity, SensorEntity):
             else:
                 self._attr_native_value = transformed_values[0] if transformed_values else None
 
-            # write the state to HA and reset state
-            self.async_write_ha_state()
-            self.__pending_data = {}
+            # write the state to HA, the buffer is kept as unchanged features are not received again
+            self.async_write_ha_state_on_change(self._attr_native_value)
@@ -0,0 +1,91 @@
+"""Services for open3e."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN
+from .definitions.open3e_data import Open3eDataFeatureWrite
+
+SERVICE_WRITE_FEATURES = "write_features"
+
+ATTR_DEVICE_ID = "device_id"
+ATTR_WRITES = "writes"
+ATTR_FEATURE_ID = "feature_id"
+ATTR_SUB_FEATURE = "sub_feature"
+ATTR_VALUE = "value"
+ATTR_FORCE = "force"
+
+WRITE_FEATURES_SCHEMA = vol.Schema({
+    vol.Required(ATTR_DEVICE_ID): cv.string,
+    vol.Required(ATTR_WRITES): vol.All(
+        cv.ensure_list,
+        vol.Length(min=1),
+        [
+            vol.Schema({
+                vol.Required(ATTR_FEATURE_ID): cv.positive_int,
+                vol.Optional(ATTR_SUB_FEATURE): cv.string,
+                vol.Required(ATTR_VALUE): object
+            })
+        ]
+    ),
+    vol.Optional(ATTR_FORCE, default=False): cv.boolean
+})
+
+
+@callback
+def async_setup_services(hass: HomeAssistant):
+    """Register the services of the integration."""
+
+    async def async_write_features(call: ServiceCall):
+        """Write several features of a device with a single Open3e command."""
+        device_entry = dr.async_get(hass).async_get(call.data[ATTR_DEVICE_ID])
+        if device_entry is None:
+            raise ServiceValidationError(translation_domain=DOMAIN, translation_key="unknown_device")
+
+        serial_number = next(
+            (identifier for domain, identifier in device_entry.identifiers if domain == DOMAIN),
+            None
+        )
+
+        for entry_id in device_entry.config_entries:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+                continue
+
+            coordinator = entry.runtime_data.coordinator
+            device = next(
+                (device for device in coordinator.system_information.devices
+                 if device.serial_number == serial_number),
+                None
+            )
+            if device is None:
+                continue
+
+            await coordinator.async_write_features(
+                device=device,
+                writes=[
+                    Open3eDataFeatureWrite(
+                        feature_id=write[ATTR_FEATURE_ID],
+                        data=write[ATTR_VALUE],
+                        sub_feature=write.get(ATTR_SUB_FEATURE)
+                    )
+                    for write in call.data[ATTR_WRITES]
+                ],
+                force=call.data[ATTR_FORCE]
+            )
+            return
+
+        raise ServiceValidationError(translation_domain=DOMAIN, translation_key="unknown_device")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WRITE_FEATURES,
+        async_write_features,
+        schema=WRITE_FEATURES_SCHEMA
+    )
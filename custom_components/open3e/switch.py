@@ -5,17 +5,19 @@ from __future__ import annotations
 from typing import cast, Any
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.json import json_loads
 
 from .coordinator import Open3eDataUpdateCoordinator
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .definitions.switches import Open3eSwitchEntityDescription, SWITCHES
 from .entity import Open3eEntity
 from .ha_data import Open3eDataConfigEntry
 from .util import map_devices_to_entities
 
+SWITCH_REGISTRY = Open3eEntityDescriptionRegistry(SWITCHES)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -24,7 +26,7 @@ async def async_setup_entry(
 ) -> None:
     device_number_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        SWITCHES
+        SWITCH_REGISTRY
     )
 
     for device, switches in device_number_map.items():
@@ -68,10 +70,11 @@ class Open3eSwitch(Open3eEntity, SwitchEntity):
 
         await self.entity_description.turn_off(self.device, self.coordinator)
 
-    async def async_on_data(self, feature_id: int) -> None:
+    @callback
+    def async_on_data(self, feature_id: int) -> None:
         """Handle updated data from MQTT."""
         if self.entity_description.is_on_state is None:
             return
 
-        self._attr_is_on = self.entity_description.is_on_state(json_loads(self.data[feature_id]))
-        self.async_write_ha_state()
+        self._attr_is_on = self.entity_description.is_on_state(self.data[feature_id].json)
+        self.async_write_ha_state_on_change(self._attr_is_on)
@@ -6,20 +6,22 @@ from typing import Any, cast
 
 from homeassistant.components.water_heater import WaterHeaterEntity, WaterHeaterEntityFeature
 from homeassistant.const import UnitOfTemperature, PRECISION_TENTHS
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.json import json_loads
 
 from custom_components.open3e.definitions.subfeatures.dmw_mode import DmwMode
 from .const import VIESSMANN_TEMP_DHW_MIN, \
     VIESSMANN_TEMP_DHW_MAX, VIESSMANN_UNAVAILABLE_VALUE
 from .coordinator import Open3eDataUpdateCoordinator
+from .definitions.entity_description import Open3eEntityDescriptionRegistry
 from .definitions.open3e_data import Open3eDataDevice
 from .definitions.water_heater import WATER_HEATER, Open3eWaterHeaterEntityDescription
 from .entity import Open3eEntity
 from .ha_data import Open3eDataConfigEntry
 from .util import map_devices_to_entities
 
+WATER_HEATER_REGISTRY = Open3eEntityDescriptionRegistry(WATER_HEATER)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -28,7 +30,7 @@ async def async_setup_entry(
 ) -> None:
     device_water_heater_map = map_devices_to_entities(
         entry.runtime_data.coordinator,
-        WATER_HEATER
+        WATER_HEATER_REGISTRY
     )
 
     # Add entities for each device
@@ -85,30 +87,37 @@ class Open3eWaterHeater(Open3eEntity, WaterHeaterEntity):
                 self.current_temperature > VIESSMANN_UNAVAILABLE_VALUE
         )
 
-    async def async_on_data(self, feature_id: int):
+    @callback
+    def async_on_data(self, feature_id: int):
         """Handle updated data from MQTT."""
         match feature_id:
             case self.entity_description.temperature_feature.id:
-                temperature_state = json_loads(self.data[feature_id])
+                temperature_state = self.data[feature_id].json
 
                 self._attr_current_temperature = float(temperature_state["Actual"])
                 self._attr_target_temperature_high = float(temperature_state["Maximum"])
                 self._attr_target_temperature_low = float(temperature_state["Minimum"])
 
             case self.entity_description.temperature_target_feature.id:
-                self._attr_target_temperature = float(self.data[feature_id])
+                self._attr_target_temperature = float(self.data[feature_id].raw)
 
             case self.entity_description.state_feature.id:
-                state_data = json_loads(self.data[feature_id])["State"]
+                state_data = self.data[feature_id].json["State"]
                 if isinstance(state_data, dict):
                     self.__currently_on = state_data.get("ID") == 1
                 else:
                     self.__currently_on = state_data == 1
 
             case self.entity_description.efficiency_mode_feature.id:
-                self.__current_efficiency_mode = int(self.data[feature_id])
-
-        self.async_write_ha_state()
+                self.__current_efficiency_mode = int(self.data[feature_id].raw)
+
+        self.async_write_ha_state_on_change(
+            self._attr_current_temperature,
+            self._attr_target_temperature_high,
+            self._attr_target_temperature_low,
+            self._attr_target_temperature,
+            self.current_operation
+        )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -0,0 +1 @@
+"""Tests for the open3e integration."""
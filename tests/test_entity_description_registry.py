@@ -0,0 +1,99 @@
+"""Tests for the index of entity descriptions."""
+
+import random
+
+import pytest
+
+from custom_components.open3e.capability.capability import Capability
+from custom_components.open3e.definitions.binary_sensors import BINARY_SENSORS
+from custom_components.open3e.definitions.climate import CLIMATE
+from custom_components.open3e.definitions.devices import Open3eDevices
+from custom_components.open3e.definitions.entity_description import Open3eEntityDescriptionRegistry
+from custom_components.open3e.definitions.fan import FAN
+from custom_components.open3e.definitions.features import FEATURE_CATALOG_IDS
+from custom_components.open3e.definitions.numbers import NUMBERS
+from custom_components.open3e.definitions.open3e_data import Open3eDataDevice, Open3eDataDeviceFeature
+from custom_components.open3e.definitions.select import SELECTS
+from custom_components.open3e.definitions.sensors import SENSORS, DERIVED_SENSORS
+from custom_components.open3e.definitions.switches import SWITCHES
+from custom_components.open3e.definitions.water_heater import WATER_HEATER
+
+DESCRIPTIONS = {
+    "binary_sensors": BINARY_SENSORS,
+    "climate": CLIMATE,
+    "fan": FAN,
+    "numbers": NUMBERS,
+    "selects": SELECTS,
+    "sensors": SENSORS,
+    "derived_sensors": DERIVED_SENSORS,
+    "switches": SWITCHES,
+    "water_heater": WATER_HEATER,
+}
+
+
+def linear_scan(descriptions, device: Open3eDataDevice):
+    """The matching of descriptions before they were indexed."""
+    device_feature_ids = {feature.id for feature in device.features}
+    result = []
+
+    for description in descriptions:
+        if description.required_device and description.required_device.display_name != device.name:
+            continue
+
+        if (
+                description.poll_data_features
+                and not {feature.id for feature in description.poll_data_features}.issubset(device_feature_ids)
+        ):
+            continue
+
+        if (
+                description.required_capabilities
+                and not set(description.required_capabilities).issubset(device.capabilities)
+        ):
+            continue
+
+        result.append(description)
+
+    return result
+
+
+def create_device(name: str, feature_ids, capabilities) -> Open3eDataDevice:
+    device = Open3eDataDevice(
+        id=1680,
+        name=name,
+        serial_number="7736605502017101",
+        software_version="1.0",
+        hardware_version="1.0",
+        features=tuple(
+            Open3eDataDeviceFeature(feature_id, f"open3e/1680_{feature_id}_Feature")
+            for feature_id in sorted(feature_ids)
+        )
+    )
+    device.capabilities = set(capabilities)
+    return device
+
+
+def devices():
+    rng = random.Random(1680)
+    catalog = sorted(FEATURE_CATALOG_IDS)
+
+    for open3e_device in Open3eDevices:
+        name = open3e_device.display_name
+        yield create_device(name, catalog, Capability)
+        yield create_device(name, catalog, ())
+        yield create_device(name, (), ())
+
+        for _ in range(10):
+            yield create_device(
+                name,
+                rng.sample(catalog, rng.randrange(len(catalog))),
+                rng.sample(list(Capability), rng.randrange(len(Capability)))
+            )
+
+
+@pytest.mark.parametrize("descriptions", DESCRIPTIONS.values(), ids=DESCRIPTIONS.keys())
+def test_registry_matches_linear_scan(descriptions):
+    registry = Open3eEntityDescriptionRegistry(descriptions)
+
+    for device in devices():
+        assert registry.descriptions_for_device(device) == linear_scan(descriptions, device)
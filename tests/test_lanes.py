@@ -0,0 +1,120 @@
+"""Tests for the per device command queues of the open3e client."""
+
+import asyncio
+import json
+
+import pytest
+
+from custom_components.open3e import api
+from custom_components.open3e.api import Open3eLane, Open3eMqttClient
+from custom_components.open3e.definitions.open3e_data import Open3eDataFeatureWrite
+
+DEVICE_ID = 1680
+
+
+class FakeHass:
+    """The parts of Home Assistant the command queues use."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+
+    def async_create_background_task(self, target, name):
+        return self.loop.create_task(target, name=name)
+
+
+@pytest.fixture
+def published(monkeypatch):
+    """Record published commands and answer reads like Open3e does."""
+    commands: list[dict] = []
+    clients: list[Open3eMqttClient] = []
+
+    async def async_publish(hass, topic, payload):
+        command = json.loads(payload)
+        commands.append(command)
+
+        if command["mode"] == "read-json":
+            for feature_id in command["data"]:
+                hass.loop.call_soon(clients[0].async_on_feature_data, DEVICE_ID, feature_id, "1")
+
+    monkeypatch.setattr(api.mqtt, "async_publish", async_publish)
+    return commands, clients
+
+
+def run(test):
+    asyncio.run(test())
+
+
+def test_commands_are_published_by_lane(published):
+    commands, clients = published
+
+    async def test():
+        hass = FakeHass()
+        client = Open3eMqttClient("open3e", "open3e/cmnd")
+        clients.append(client)
+
+        # All commands are queued before the dispatcher of the device runs
+        await asyncio.gather(
+            client.async_request_data(hass, {DEVICE_ID: [268]}, Open3eLane.SlowPoll),
+            client.async_request_data(hass, {DEVICE_ID: [269]}, Open3eLane.FastPoll),
+            client.async_request_data(hass, {DEVICE_ID: [271]}, Open3eLane.Confirmation),
+            client.async_write(hass, DEVICE_ID, [Open3eDataFeatureWrite(feature_id=396, data=50)]),
+            client.async_request_data(hass, {DEVICE_ID: [274]}, Open3eLane.FastPoll),
+        )
+        client.async_shutdown()
+
+    run(test)
+
+    assert [command["mode"] for command in commands] == ["write", "read-json", "read-json", "read-json", "read-json"]
+    assert [command["data"] for command in commands[1:]] == [[271], [269], [274], [268]]
+
+
+def test_confirmation_is_not_held_back_by_budget_debt(published):
+    commands, clients = published
+
+    async def test():
+        hass = FakeHass()
+        client = Open3eMqttClient("open3e", "open3e/cmnd", reads_per_second=1)
+        clients.append(client)
+        client.read_budget.charge(30)
+
+        await asyncio.wait_for(
+            client.async_read(hass, DEVICE_ID, [271], lane=Open3eLane.Confirmation),
+            timeout=1
+        )
+        client.async_shutdown()
+
+    run(test)
+
+    assert [command["data"] for command in commands] == [[271]]
+
+
+def test_read_completes_only_with_answers_published_after_it(monkeypatch):
+    commands: list[dict] = []
+
+    async def async_publish(hass, topic, payload):
+        commands.append(json.loads(payload))
+
+    monkeypatch.setattr(api.mqtt, "async_publish", async_publish)
+
+    async def test():
+        hass = FakeHass()
+        client = Open3eMqttClient("open3e", "open3e/cmnd")
+
+        await client.async_request_data(hass, {DEVICE_ID: [271]}, Open3eLane.FastPoll)
+        read = asyncio.ensure_future(client.async_read(hass, DEVICE_ID, [271]))
+        while len(commands) < 2:
+            await asyncio.sleep(0)
+
+        # The answer to the poll published before the read does not complete it
+        client.async_on_feature_data(DEVICE_ID, 271, "40.5")
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert not read.done()
+
+        client.async_on_feature_data(DEVICE_ID, 271, "50.0")
+        await asyncio.wait_for(read, timeout=1)
+        client.async_shutdown()
+
+    run(test)
+
+    assert [command["data"] for command in commands] == [[271], [271]]
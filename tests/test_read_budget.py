@@ -0,0 +1,60 @@
+"""Tests for the read budget of the open3e client."""
+
+import pytest
+
+from custom_components.open3e import api
+from custom_components.open3e.api import Open3eReadBudget
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """Control the monotonic clock the budget refills with."""
+    clock = [1000.0]
+    monkeypatch.setattr(api.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_reserve_within_budget(now):
+    budget = Open3eReadBudget(10)
+
+    assert budget.reserve(4) == 0
+    assert budget.reserve(6) == 0
+
+
+def test_reserve_returns_seconds_until_reads_are_available(now):
+    budget = Open3eReadBudget(10)
+    assert budget.reserve(6) == 0
+
+    assert budget.reserve(9) == pytest.approx(0.5)
+
+    now[0] += 0.5
+    assert budget.reserve(9) == 0
+
+
+def test_budget_does_not_refill_above_reads_per_second(now):
+    budget = Open3eReadBudget(10)
+
+    now[0] += 60
+    assert budget.reserve(10) == 0
+    assert budget.reserve(1) == pytest.approx(0.1)
+
+
+def test_reserve_more_reads_than_budget_once_full(now):
+    budget = Open3eReadBudget(10)
+
+    assert budget.reserve(30) == 0
+
+    # The debt of 20 reads is paid back before the next reads
+    assert budget.reserve(5) == pytest.approx(2.5)
+    now[0] += 2.5
+    assert budget.reserve(5) == 0
+
+
+def test_charge_takes_reads_without_waiting(now):
+    budget = Open3eReadBudget(10)
+
+    budget.charge(15)
+
+    assert budget.reserve(5) == pytest.approx(1)
+    now[0] += 1
+    assert budget.reserve(5) == 0